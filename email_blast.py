@@ -3,14 +3,38 @@ Email Blast minigame - typing test for Consulting Chaos.
 """
 from __future__ import annotations
 
-import time
 from typing import TYPE_CHECKING
 
-from game_common import Scene, MinigameResult, CANVAS_W, CANVAS_H, BG, FG, ACCENT, GOOD, BAD, WARN, MUTED, CARD, EMAIL_PENALTY_PER_MISS, JARGON
+from game_common import Scene, MinigameResult, build_start_overlay, CANVAS_W, CANVAS_H, BG, FG, ACCENT, GOOD, BAD, WARN, MUTED, CARD, EMAIL_PENALTY_PER_MISS, EMAIL_TEXT_CHARS, EMAIL_DOC_CHARS, JARGON
+from email_jargon import PhraseIndex
+from email_text import FontMetrics, TypingBuffer, line_of, wrap
 
 if TYPE_CHECKING:
     from main import GameApp
 
+# Consulting phrases of various lengths
+PHRASES = [
+    "Let's circle back post-standup and align on next steps.",
+    "Driving synergy for cross-functional KPIs and stakeholder buy-in.",
+    "Deck alignment before EOD, thanks for the quick turnaround.",
+    "Can we socialize the roadmap ASAP and get feedback?",
+    "Low-hanging fruit for Q4 quick wins and revenue impact.",
+    "Double-click the assumptions and de-risk the approach.",
+    "Let's park this and revisit offline with the team.",
+    "Push the deck to green for tomorrow's steerco meeting.",
+    "Need to deep-dive the data and validate assumptions.",
+    "Schedule a sync to discuss the strategic implications.",
+    "Moving forward with the recommended approach and timeline.",
+    "Stakeholder alignment is critical for project success.",
+    "Let's prioritize the high-impact initiatives first.",
+    "Need to socialize this with leadership before proceeding.",
+    "Quick wins will help build momentum for larger changes.",
+]
+# Reachable prompt lengths, worked out once; any length comes back exact
+PHRASE_INDEX = PhraseIndex(PHRASES)
+
+TEXT_FONT = ("TkDefaultFont", 12)
+
 
 class EmailBlast(Scene):
     name = "Email Blast"
@@ -20,55 +44,40 @@ class EmailBlast(Scene):
         self.start_time = 0.0
         self.end_time = 0.0
         self.target = ""
-        self.typed = ""
+        self.typed = TypingBuffer("")
         self.misses = 0
+        self._shown = -1  # typed.version the response area shows
+        # Long-form memo: line starts of the wrapped target, and how many fit in a box
+        self.long_form = False
+        self.lines = None
+        self.rows = 0
+        self.line_h = 0
 
     # --- helpers ---
     def elapsed(self) -> float:
-        end = self.end_time if self.end_time else time.perf_counter()
+        end = self.end_time if self.end_time else self.clock.now()
         return max(0.0, end - self.start_time) if self.started else 0.0
 
     def _generate_consulting_text(self, target_length: int, rng) -> str:
-        """Generate consulting jargon text with approximately target_length characters"""
-        # Consulting phrases of various lengths
-        phrases = [
-            "Let's circle back post-standup and align on next steps.",
-            "Driving synergy for cross-functional KPIs and stakeholder buy-in.",
-            "Deck alignment before EOD, thanks for the quick turnaround.",
-            "Can we socialize the roadmap ASAP and get feedback?",
-            "Low-hanging fruit for Q4 quick wins and revenue impact.",
-            "Double-click the assumptions and de-risk the approach.",
-            "Let's park this and revisit offline with the team.",
-            "Push the deck to green for tomorrow's steerco meeting.",
-            "Need to deep-dive the data and validate assumptions.",
-            "Schedule a sync to discuss the strategic implications.",
-            "Moving forward with the recommended approach and timeline.",
-            "Stakeholder alignment is critical for project success.",
-            "Let's prioritize the high-impact initiatives first.",
-            "Need to socialize this with leadership before proceeding.",
-            "Quick wins will help build momentum for larger changes.",
-        ]
-        
-        # Sample 10 phrases without replacement
-        selected_phrases = rng.sample(phrases, min(3, len(phrases)))
-        
-        # Build the string from the selected phrases
-        text = " ".join(selected_phrases)
-        
-        # If we need to add more phrases to reach target length
-        if len(text) < target_length - 20:  # If significantly under target
-            # Add more phrases if we have room
-            remaining_phrases = [p for p in phrases if p not in selected_phrases]
-            while len(text) < target_length - 10 and remaining_phrases:
-                next_phrase = rng.choice(remaining_phrases)
-                text += " " + next_phrase
-                remaining_phrases.remove(next_phrase)
-        return text
+        """Generate consulting jargon text of exactly target_length characters
+        (or the nearest length the phrases can make)"""
+        length = PHRASE_INDEX.nearest(target_length)
+        return PHRASE_INDEX.make(length, rng) if length is not None else ""
+
+    def _generate_memo(self, length: int, rng) -> str:
+        """A client memo of at least ``length`` characters: paragraphs of 3-6 phrases"""
+        paragraphs = []
+        total = 0
+        while total < length:
+            paragraph = " ".join(rng.choice(PHRASES) for _ in range(rng.randint(3, 6)))
+            paragraphs.append(paragraph)
+            total += len(paragraph) + 1
+        return "\n".join(paragraphs)
 
     def finish(self, app: "GameApp") -> None:
         if not self.started:
             return
-        self.end_time = time.perf_counter()
+        self.end_time = self.clock.now()
         pen = self.misses * EMAIL_PENALTY_PER_MISS
         result = MinigameResult(
             name=self.name,
@@ -85,24 +94,37 @@ class EmailBlast(Scene):
     # --- lifecycle ---
     def on_enter(self, app: "GameApp") -> None:
         rng = app.rng
-        # Generate text with consistent length (150 ± 5 characters)
-        target_length = rng.randint(145, 155)
-        self.target = self._generate_consulting_text(target_length, rng)
-        self.typed = ""
+        self.long_form = EMAIL_DOC_CHARS > 0
+        if self.long_form:
+            self.target = self._generate_memo(EMAIL_DOC_CHARS, rng)
+            # Wrapped once, at the width of the text boxes; draw shows a window of lines
+            metrics = FontMetrics(TEXT_FONT, app.root)
+            self.lines = wrap(self.target, CANVAS_W - 70, metrics)
+            self.line_h = metrics.linespace
+            self.rows = max(1, 110 // self.line_h)
+        else:
+            # Same length every run, so scores compare
+            self.target = self._generate_consulting_text(EMAIL_TEXT_CHARS, rng)
+        self.typed = TypingBuffer(self.target)
         self.misses = 0
+        self._shown = -1
         self.started = False
         self.start_time = 0.0
         self.end_time = 0.0
+        self._build()
 
     def update(self, app: "GameApp", dt: float) -> None:
-        app.toasts.update(dt)
+        # Timer while typing; toast expiry
+        if app.toasts.update(dt) or self.started:
+            self.invalidate()
 
-    def draw(self, app: "GameApp", c) -> None:
-        c.delete("all")
-        c.create_rectangle(0, 0, CANVAS_W, CANVAS_H, fill=BG, width=0)
+    def _build(self) -> None:
+        v = self.view
+        v.rect("bg", 0, 0, CANVAS_W, CANVAS_H, fill=BG, width=0)
 
         # Header
-        c.create_text(
+        v.text(
+            "header",
             20,
             20,
             text=f"{self.name}",
@@ -111,29 +133,32 @@ class EmailBlast(Scene):
             anchor="nw",
         )
         
-        # Instructions summary (top left)
-        if self.started:
-            c.create_text(
-                20,
-                50,
-                text="Type text • Backspace fixes • Enter submits",
-                fill=MUTED,
-                font=("TkDefaultFont", 10),
-                anchor="nw",
-            )
+        # Instructions summary (top left, shown once started)
+        v.text(
+            "hint",
+            20,
+            50,
+            text="Type text • Backspace fixes • Enter submits",
+            fill=MUTED,
+            font=("TkDefaultFont", 10),
+            anchor="nw",
+            state="hidden",
+        )
         # Timer HUD
-        c.create_text(
+        v.text(
+            "timer",
             CANVAS_W - 20,
             20,
-            text=f"Time: {self.elapsed():.2f}s",
+            text="",
             fill=FG,
             font=("TkDefaultFont", 14, "bold"),
             anchor="ne",
         )
-        c.create_text(
+        v.text(
+            "pen",
             CANVAS_W - 20,
             44,
-            text=f"Pen: {self.misses} x {EMAIL_PENALTY_PER_MISS:.1f}s",
+            text="",
             fill=WARN,
             font=("TkDefaultFont", 12),
             anchor="ne",
@@ -147,83 +172,73 @@ class EmailBlast(Scene):
         email_h = 400
         
         # Email window frame
-        c.create_rectangle(email_x, email_y, email_x + email_w, email_y + email_h, 
-                           fill="#ffffff", width=2, outline="#cccccc")
+        v.rect("email", email_x, email_y, email_x + email_w, email_y + email_h, 
+               fill="#ffffff", width=2, outline="#cccccc")
         
         # Email header bar
-        c.create_rectangle(email_x, email_y, email_x + email_w, email_y + 30, 
-                           fill="#f5f5f5", width=0)
-        c.create_text(email_x + 10, email_y + 15, text="New Email", 
-                      fill="#333333", font=("TkDefaultFont", 12, "bold"), anchor="w")
+        v.rect("email.bar", email_x, email_y, email_x + email_w, email_y + 30, 
+               fill="#f5f5f5", width=0)
+        v.text("email.bar_text", email_x + 10, email_y + 15, text="New Email", 
+               fill="#333333", font=("TkDefaultFont", 12, "bold"), anchor="w")
         
         # Email fields
         field_y = email_y + 50
-        c.create_text(email_x + 10, field_y, text="To:", 
-                      fill="#666666", font=("TkDefaultFont", 11, "bold"), anchor="w")
-        c.create_text(email_x + 30, field_y, text="client@fortune500.com", 
-                      fill="#333333", font=("TkDefaultFont", 11), anchor="w")
+        v.text("email.to", email_x + 10, field_y, text="To:", 
+               fill="#666666", font=("TkDefaultFont", 11, "bold"), anchor="w")
+        v.text("email.to_value", email_x + 30, field_y, text="client@fortune500.com", 
+               fill="#333333", font=("TkDefaultFont", 11), anchor="w")
         
         field_y += 25
-        c.create_text(email_x + 10, field_y, text="Subject:", 
-                      fill="#666666", font=("TkDefaultFont", 11, "bold"), anchor="w")
-        c.create_text(email_x + 70, field_y, text="Urgent: Q4 Strategy Update", 
-                      fill="#333333", font=("TkDefaultFont", 11), anchor="w")
+        v.text("email.subject", email_x + 10, field_y, text="Subject:", 
+               fill="#666666", font=("TkDefaultFont", 11, "bold"), anchor="w")
+        v.text("email.subject_value", email_x + 70, field_y, text="Urgent: Q4 Strategy Update", 
+               fill="#333333", font=("TkDefaultFont", 11), anchor="w")
         
         # Email body separator
         field_y += 30
-        c.create_line(email_x + 10, field_y, email_x + email_w - 10, field_y, 
-                      fill="#cccccc", width=1)
+        v.line("email.sep", email_x + 10, field_y, email_x + email_w - 10, field_y, 
+               fill="#cccccc", width=1)
         
         # Email body area
         body_y = field_y + 20
-        c.create_text(email_x + 10, body_y, text="Email Body:", 
-                      fill="#666666", font=("TkDefaultFont", 11, "bold"), anchor="w")
+        v.text("email.body", email_x + 10, body_y, text="Email Body:", 
+               fill="#666666", font=("TkDefaultFont", 11, "bold"), anchor="w")
         
         # Target text (what they need to type)
         target_y = body_y + 30
-        c.create_rectangle(email_x + 10, target_y, email_x + email_w - 10, target_y + 120, 
-                           fill="#fafafa", width=1, outline="#dddddd")
-        c.create_text(
-            email_x + 15,
-            target_y + 60,
-            text=self.target,
-            fill="#333333",
-            font=("TkDefaultFont", 12),
-            width=email_w - 30,
-            justify="left",
-            anchor="w"
-        )
-        
-        # Typed text area (what they've typed so far)
-        typed_y = target_y + 140
-        c.create_rectangle(email_x + 10, typed_y, email_x + email_w - 10, typed_y + 120, 
-                           fill="#ffffff", width=1, outline="#4CAF50")
-        c.create_text(email_x + 10, typed_y - 15, text="Your Response:", 
-                      fill="#4CAF50", font=("TkDefaultFont", 11, "bold"), anchor="w")
-        # Colorize typed vs target
-        correct_len = 0
-        for i, ch in enumerate(self.typed):
-            if i < len(self.target) and ch == self.target[i]:
-                correct_len += 1
-            else:
-                break
-        # Draw typed text in the email response area
-        if self.typed:
-            # Show the typed text in the response area
-            text_color = "#4CAF50" if correct_len == len(self.typed) else "#f44336"
-            c.create_text(
+        v.rect("target.box", email_x + 10, target_y, email_x + email_w - 10, target_y + 120, 
+               fill="#fafafa", width=1, outline="#dddddd")
+        if not self.long_form:
+            v.text(
+                "target",
                 email_x + 15,
-                typed_y + 60,
-                text=self.typed,
-                fill=text_color,
-                font=("TkDefaultFont", 12),
+                target_y + 60,
+                text=self.target,
+                fill="#333333",
+                font=TEXT_FONT,
                 width=email_w - 30,
                 justify="left",
                 anchor="w"
             )
+        
+        # Typed text area (what they've typed so far)
+        typed_y = target_y + 140
+        v.rect("typed.box", email_x + 10, typed_y, email_x + email_w - 10, typed_y + 120, 
+               fill="#ffffff", width=1, outline="#4CAF50")
+        v.text("typed.label", email_x + 10, typed_y - 15, text="Your Response:", 
+               fill="#4CAF50", font=("TkDefaultFont", 11, "bold"), anchor="w")
+        if self.long_form:
+            # One item per visible line in each box, refilled as the memo scrolls
+            for r in range(self.rows):
+                v.text(f"doc.target{r}", email_x + 15, target_y + 5 + r * self.line_h, text="",
+                       fill="#333333", font=TEXT_FONT, anchor="nw")
+                v.text(f"doc.typed{r}", email_x + 15, typed_y + 5 + r * self.line_h, text="",
+                       fill="#4CAF50", font=TEXT_FONT, anchor="nw")
+            v.text("doc.progress", email_x + email_w - 10, typed_y - 15, text="",
+                   fill="#666666", font=("TkDefaultFont", 10), anchor="e")
         else:
-            # Show placeholder text when nothing typed
-            c.create_text(
+            v.text(
+                "typed",
                 email_x + 15,
                 typed_y + 60,
                 text="Type your response here...",
@@ -235,24 +250,10 @@ class EmailBlast(Scene):
             )
 
         # Start/help overlay
-        if not self.started:
-            # BCG-style professional overlay
-            c.create_rectangle(0, 0, CANVAS_W, CANVAS_H, fill="#1a1a2e", stipple="gray25", width=0)
-            
-            # Header section
-            c.create_rectangle(40, 80, CANVAS_W - 40, 120, fill="#0f3460", width=2, outline="#4a90e2")
-            c.create_text(
-                CANVAS_W // 2,
-                100,
-                text="BCG STRATEGIC COMMUNICATION ASSESSMENT",
-                fill="#4a90e2",
-                font=("TkDefaultFont", 16, "bold"),
-            )
-            
-            # Main content box
-            c.create_rectangle(60, 140, CANVAS_W - 60, 400, fill="#2c3e50", width=2, outline="#34495e")
-            
-            lines = [
+        build_start_overlay(
+            v,
+            "BCG STRATEGIC COMMUNICATION ASSESSMENT",
+            [
                 "CLIENT CRISIS SCENARIO:",
                 "Your Fortune 500 client needs 47 critical emails",
                 "sent to stakeholders by 5:00 PM EST.",
@@ -266,27 +267,56 @@ class EmailBlast(Scene):
                 "Backspace corrects mistakes. Enter submits when complete.",
                 "",
                 "Press Enter to Begin Assessment"
-            ]
-            c.create_text(
-                CANVAS_W // 2,
-                270,
-                text="\n".join(lines),
-                fill="#ecf0f1",
-                font=("TkDefaultFont", 12),
-                justify="center",
-            )
-            
-            # Professional call-to-action button
-            c.create_rectangle(CANVAS_W // 2 - 150, 420, CANVAS_W // 2 + 150, 460, fill="#e74c3c", width=0)
-            c.create_text(
-                CANVAS_W // 2,
-                440,
-                text="BEGIN EMAIL ASSESSMENT",
-                fill="#ffffff",
-                font=("TkDefaultFont", 12, "bold"),
-            )
+            ],
+            "BEGIN EMAIL ASSESSMENT",
+        )
+
+    def draw(self, app: "GameApp", c) -> None:
+        v = self.view
+        v.show("hint", self.started)
+        v.config("timer", text=f"Time: {self.elapsed():.2f}s")
+        v.config("pen", text=f"Pen: {self.misses} x {EMAIL_PENALTY_PER_MISS:.1f}s")
 
-        app.toasts.draw(c)
+        # Colorize typed vs target; the buffer tracks matches as keys arrive,
+        # so only an edit since the last draw costs anything here
+        if self.typed.version != self._shown:
+            self._shown = self.typed.version
+            if self.long_form:
+                self._draw_lines(v)
+            elif len(self.typed):
+                # Show the typed text in the response area
+                text_color = "#4CAF50" if self.typed.clean else "#f44336"
+                v.config("typed", text=self.typed.text(), fill=text_color, font=("TkDefaultFont", 12))
+            else:
+                # Show placeholder text when nothing typed
+                v.config("typed", text="Type your response here...", fill="#999999",
+                         font=("TkDefaultFont", 12, "italic"))
+
+        v.show_group("overlay", not self.started)
+        app.toasts.draw(v)
+
+    def _draw_lines(self, v) -> None:
+        """Fill the line items with the memo lines around the cursor (both boxes scroll together)"""
+        typed, starts, target = self.typed, self.lines, self.target
+        n = len(starts)
+        cur = line_of(starts, typed.cursor)
+        first = max(0, min(cur - 1, n - self.rows))
+        for r in range(self.rows):
+            k = first + r
+            a = starts[k] if k < n else len(target)
+            b = starts[k + 1] if k + 1 < n else len(target)
+            end = min(b, typed.cursor)
+            v.config(f"doc.target{r}", text=target[a:b].rstrip("\n"))
+            if not len(typed) and r == 0:
+                v.config("doc.typed0", text="Type your response here...", fill="#999999",
+                         font=("TkDefaultFont", 12, "italic"))
+            elif a < end:
+                ok = typed.status.find(0, a, end) < 0  # no wrong character on this line
+                v.config(f"doc.typed{r}", text=typed.text(a, end).rstrip("\n"),
+                         fill="#4CAF50" if ok else "#f44336", font=TEXT_FONT)
+            else:
+                v.config(f"doc.typed{r}", text="")
+        v.config("doc.progress", text=f"Line {cur + 1}/{n}")
 
     def handle_key(self, app: "GameApp", e) -> None:
         if e.keysym == "Escape":
@@ -295,25 +325,24 @@ class EmailBlast(Scene):
         if not self.started:
             if e.keysym in ("Return", "space"):
                 self.started = True
-                self.start_time = time.perf_counter()
+                self.start_time = self.clock.now()
             return
         # Active typing
         if e.keysym == "BackSpace":
-            if self.typed:
-                self.typed = self.typed[:-1]
+            self.typed.backspace()
             return
         if e.keysym == "Return":
-            if self.typed == self.target:
+            if self.typed.done:
                 self.finish(app)
+            elif self.long_form and self.typed.cursor < len(self.target) and self.target[self.typed.cursor] == "\n":
+                self.typed.type("\n")  # paragraph break
             else:
                 app.toasts.add("Not matching yet")
             return
         ch = e.char
         if ch:
-            idx = len(self.typed)
-            if idx >= len(self.target) or ch != self.target[idx]:
+            if not self.typed.type(ch):
                 self.misses += 1
                 app.toasts.add(f"Mismatch +{EMAIL_PENALTY_PER_MISS:.1f}s")
-            self.typed += ch
-            if self.typed == self.target:
+            if self.typed.done:
                 self.finish(app)
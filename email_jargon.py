@@ -0,0 +1,74 @@
+"""
+Exact-length jargon for the Email Blast minigame.
+
+``PhraseIndex`` groups a phrase corpus by length and runs a bounded
+subset-sum over the groups once, keeping one bitset of reachable totals per
+group prefix. A request then walks the groups backwards choosing how many
+phrases of each length to use and draws that many from the group, so its
+cost depends on the number of distinct lengths (a few dozen at most), not on
+the size of the corpus.
+"""
+from __future__ import annotations
+
+import random
+from pathlib import Path
+from typing import Iterable, Optional
+
+
+class PhraseIndex:
+    """Which text lengths ``" ".join(phrases)`` can hit, and a way to hit them.
+
+    Each phrase costs its length plus one separator, so a text of ``n``
+    characters is a subset of phrases costing ``n + 1``. ``reach[g]`` has bit
+    ``s`` set when the first ``g`` length groups can make cost ``s``; totals
+    above ``max_length + 1`` are dropped. Phrases are never repeated in a text.
+    """
+
+    def __init__(self, phrases: Iterable[str], max_length: int = 1000):
+        by_len: dict[int, list[str]] = {}
+        for p in phrases:
+            p = p.strip()
+            if p:
+                by_len.setdefault(len(p), []).append(p)
+        self.max_length = max_length
+        self.groups = [(n + 1, by_len[n]) for n in sorted(by_len)]  # (cost, phrases)
+        limit = (1 << (max_length + 2)) - 1
+        self.reach = [1]
+        for cost, group in self.groups:
+            prev = self.reach[-1]
+            bits = prev
+            for j in range(1, min(len(group), (max_length + 1) // cost) + 1):
+                bits |= prev << (j * cost)
+            self.reach.append(bits & limit)
+
+    @classmethod
+    def from_file(cls, path: Path, max_length: int = 1000) -> "PhraseIndex":
+        """Index a corpus stored one phrase per line."""
+        return cls(path.read_text(encoding="utf-8").splitlines(), max_length)
+
+    def can_make(self, length: int) -> bool:
+        return 0 < length <= self.max_length and bool(self.reach[-1] >> (length + 1) & 1)
+
+    def nearest(self, length: int) -> Optional[int]:
+        """The reachable length closest to ``length`` (shorter wins ties), or None."""
+        for d in range(self.max_length + 1):
+            for n in (length - d, length + d):
+                if self.can_make(n):
+                    return n
+        return None
+
+    def make(self, length: int, rng: random.Random) -> Optional[str]:
+        """Random distinct phrases joined by spaces, exactly ``length`` characters; None if impossible."""
+        if not self.can_make(length):
+            return None
+        left = length + 1
+        picks: list[str] = []
+        for g in range(len(self.groups) - 1, -1, -1):
+            cost, group = self.groups[g]
+            before = self.reach[g]
+            counts = [j for j in range(min(len(group), left // cost) + 1) if before >> (left - j * cost) & 1]
+            j = rng.choice(counts)
+            picks += rng.sample(group, j)
+            left -= j * cost
+        rng.shuffle(picks)
+        return " ".join(picks)
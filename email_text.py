@@ -0,0 +1,159 @@
+"""
+Typing state for the Email Blast minigame.
+
+Typing only ever happens at the end of the text, so the buffer is a list of
+characters (append and backspace are O(1)) plus a per-character match flag
+and a running count of the correct prefix. Nothing is rescanned per
+keystroke or per frame, whatever the length of the target.
+
+Long documents are wrapped once into line start offsets using cached
+per-character font widths, so drawing only ever touches the lines in view.
+"""
+from __future__ import annotations
+
+import re
+from array import array
+from bisect import bisect_right
+from typing import Optional
+
+try:
+    from tkinter import font as tkfont
+except Exception:  # pragma: no cover
+    tkfont = None
+
+
+class TypingBuffer:
+    """What has been typed so far against a fixed ``target``.
+
+    ``status[i]`` is 1 where ``typed[i] == target[i]``; ``correct`` is the
+    length of the matching prefix and ``version`` bumps on every edit so
+    drawing code can skip unchanged frames.
+    """
+
+    def __init__(self, target: str):
+        self.target = target
+        self.chars: list[str] = []
+        self.status = bytearray()
+        self.correct = 0
+        self.version = 0
+
+    def __len__(self) -> int:
+        return len(self.chars)
+
+    @property
+    def cursor(self) -> int:
+        return len(self.chars)
+
+    @property
+    def clean(self) -> bool:
+        """No wrong characters typed (the text so far is a prefix of the target)."""
+        return self.correct == len(self.chars)
+
+    @property
+    def done(self) -> bool:
+        return self.correct == len(self.target) == len(self.chars)
+
+    def type(self, ch: str) -> bool:
+        """Append ``ch``; True if it matches the target at the cursor."""
+        i = len(self.chars)
+        ok = i < len(self.target) and self.target[i] == ch
+        self.chars.append(ch)
+        self.status.append(ok)
+        if ok and self.correct == i:
+            self.correct += 1
+        self.version += 1
+        return ok
+
+    def backspace(self) -> bool:
+        """Remove the last character; False if there was none."""
+        if not self.chars:
+            return False
+        self.chars.pop()
+        self.status.pop()
+        self.correct = min(self.correct, len(self.chars))
+        self.version += 1
+        return True
+
+    def text(self, start: int = 0, end: Optional[int] = None) -> str:
+        """Typed characters ``start:end`` as a string (O(end - start))."""
+        return "".join(self.chars[start:end])
+
+# a word with the spaces and (at most one) newline after it
+_TOKEN = re.compile(r"([^ \n]*)( *)(\n?)")
+
+
+class FontMetrics:
+    """Pixel widths of characters and words in one font, measured once each.
+
+    Without a Tk root (headless runs) Tk can't measure anything, so every
+    character counts as ``0.6 * size`` px; layout still works and is the
+    same on every machine.
+    """
+
+    def __init__(self, font: tuple, root=None):
+        self._widths: dict[str, int] = {}
+        self._words: dict[str, int] = {}
+        size = abs(font[1])
+        self._measure = None
+        if root is not None and tkfont is not None:
+            tk_font = tkfont.Font(root=root, font=font)
+            self._measure = tk_font.measure
+            self.linespace = tk_font.metrics("linespace")
+        else:
+            self._fallback = round(size * 0.6)
+            self.linespace = round(size * 1.6)
+
+    def width(self, ch: str) -> int:
+        w = self._widths.get(ch)
+        if w is None:
+            w = self._measure(ch) if self._measure is not None else self._fallback
+            self._widths[ch] = w
+        return w
+
+    def text_width(self, word: str) -> int:
+        """Width of ``word``, summed from character widths (no kerning)."""
+        w = self._words.get(word)
+        if w is None:
+            w = sum(self.width(c) for c in word)
+            self._words[word] = w
+        return w
+
+
+def wrap(text: str, width: float, metrics: FontMetrics) -> array:
+    """Start offset of every display line of ``text`` wrapped to ``width`` px.
+
+    Lines break after spaces and newlines (which stay on the line they end),
+    and mid-word only when a word is wider than a whole line. Line ``k`` is
+    ``text[starts[k]:starts[k + 1]]``.
+    """
+    starts = array("i", [0])
+    char_w = metrics.width
+    space = char_w(" ")
+    n = len(text)
+    x = 0
+    for m in _TOKEN.finditer(text):
+        i = m.start()
+        word, spaces, newline = m.group(1, 2, 3)
+        word_w = metrics.text_width(word)
+        if x and x + word_w > width:
+            starts.append(i)
+            x = 0
+        if word_w > width:
+            for k, c in enumerate(word, i):
+                if x and x + char_w(c) > width:
+                    starts.append(k)
+                    x = 0
+                x += char_w(c)
+        else:
+            x += word_w
+        x += space * len(spaces)
+        if newline:
+            if m.end() < n:
+                starts.append(m.end())
+            x = 0
+    return starts
+
+
+def line_of(starts: array, index: int) -> int:
+    """Display line holding character ``index``."""
+    return bisect_right(starts, index) - 1
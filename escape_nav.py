@@ -0,0 +1,475 @@
+"""
+Maze navigation for the Friday Escape minigame.
+
+Tiles are addressed by flat index ``y * width + x`` so per-step lookups are
+plain list/array indexing instead of tuple maths and bounds checks.
+"""
+from __future__ import annotations
+
+import hashlib
+import heapq
+import math
+import os
+import struct
+import threading
+from array import array
+from collections import deque
+from pathlib import Path
+from typing import Iterable, Optional, Sequence
+
+
+class MazeGraph:
+    """Floor adjacency of a 0/1 grid (0 floor, 1 wall), built once.
+
+    ``set_floor`` opens or closes single tiles afterwards (doors).
+    """
+
+    def __init__(self, grid: list[list[int]]):
+        self.h = len(grid)
+        self.w = len(grid[0]) if grid else 0
+        self.size = self.w * self.h
+        self.floor = bytearray(1 if cell == 0 else 0 for row in grid for cell in row)
+        # neighbours in the same order _neighbors4 used: right, left, down, up
+        self.adj: list[tuple[int, ...]] = [self._links(i) for i in range(self.size)]
+
+    def around(self, i: int) -> tuple[int, ...]:
+        """In-bounds orthogonal neighbours of ``i``, floor or not."""
+        w = self.w
+        x = i % w
+        out = []
+        if x + 1 < w:
+            out.append(i + 1)
+        if x > 0:
+            out.append(i - 1)
+        if i + w < self.size:
+            out.append(i + w)
+        if i >= w:
+            out.append(i - w)
+        return tuple(out)
+
+    def _links(self, i: int) -> tuple[int, ...]:
+        if not self.floor[i]:
+            return ()
+        floor = self.floor
+        return tuple(j for j in self.around(i) if floor[j])
+
+    def set_floor(self, i: int, is_floor: bool) -> bool:
+        """Open or close tile ``i``; return True if it changed."""
+        if bool(self.floor[i]) == is_floor:
+            return False
+        self.floor[i] = 1 if is_floor else 0
+        self.adj[i] = self._links(i)
+        for j in self.around(i):
+            self.adj[j] = self._links(j)
+        return True
+
+    def index(self, pos: tuple[int, int]) -> int:
+        return pos[1] * self.w + pos[0]
+
+    def pos(self, i: int) -> tuple[int, int]:
+        return i % self.w, i // self.w
+
+
+class FlowField:
+    """BFS distance field towards one target tile, shared by every enemy.
+
+    ``retarget`` reruns the BFS only when the target tile changed; after that
+    ``next_hop[i]`` is the neighbour of ``i`` one step closer to the target
+    (``i`` itself on the target, -1 if unreachable), so an enemy step is a
+    single lookup no matter how many enemies there are.
+
+    On big mazes the BFS can be spread over frames: ``begin`` starts it,
+    ``advance`` expands a budget of tiles, and ``dist``/``next_hop`` keep
+    describing the previous target until the new field is complete.
+
+    When a tile opens or closes, ``update_cell`` repairs the field locally
+    (only tiles whose distance can change are revisited) instead of
+    running the whole BFS again. ``work`` counts tiles visited by either.
+    """
+
+    def __init__(self, graph: MazeGraph):
+        self.graph = graph
+        self.target = -1
+        self.dist = array("i", [-1]) * graph.size
+        self.next_hop = array("i", [-1]) * graph.size
+        self._pending = -1  # target of the BFS in progress
+        self._queue: deque[int] = deque()
+        self._dist = self.dist
+        self._hop = self.next_hop
+        self.work = 0
+
+    def retarget(self, target: int) -> bool:
+        """Point the field at ``target``; return True if it had to be rebuilt."""
+        if target == self.target and self._pending < 0:
+            return False
+        self.begin(target)
+        self.advance(math.inf)
+        return True
+
+    def begin(self, target: int) -> None:
+        """Start rebuilding the field towards ``target`` (no-op if already there or underway)."""
+        if target == (self._pending if self._pending >= 0 else self.target):
+            return
+        self._start(target)
+
+    def _start(self, target: int) -> None:
+        n = self.graph.size
+        self._pending = target
+        self._dist = array("i", [-1]) * n
+        self._hop = array("i", [-1]) * n
+        self._queue = deque()
+        if 0 <= target < n and self.graph.floor[target]:
+            self._dist[target] = 0
+            self._hop[target] = target
+            self._queue.append(target)
+
+    def advance(self, budget: float) -> bool:
+        """Expand up to ``budget`` tiles of the pending BFS; True once the field is current."""
+        if self._pending < 0:
+            return True
+        queue, dist, hop, adj = self._queue, self._dist, self._hop, self.graph.adj
+        while queue and budget > 0:
+            budget -= 1
+            self.work += 1
+            cur = queue.popleft()
+            d = dist[cur] + 1
+            for nb in adj[cur]:
+                if dist[nb] < 0:
+                    dist[nb] = d
+                    hop[nb] = cur  # BFS parent is one step nearer the target
+                    queue.append(nb)
+        if queue:
+            return False
+        self.target, self.dist, self.next_hop = self._pending, dist, hop
+        self._pending = -1
+        return True
+
+    def update_cell(self, i: int) -> None:
+        """Repair the field after ``graph.set_floor(i, ...)``."""
+        if self._pending >= 0:
+            self._start(self._pending)  # half-built BFS may have read the old tile
+        if self.target < 0:
+            return
+        if i == self.target or not self.graph.floor[self.target]:
+            self._start(self.target)
+            self.advance(math.inf)
+            return
+        if self.graph.floor[i]:
+            self._opened(i)
+        else:
+            self._closed(i)
+
+    def _opened(self, i: int) -> None:
+        # Distances can only shrink: seed the new tile from its best
+        # neighbour and push improvements outwards.
+        dist, hop, adj = self.dist, self.next_hop, self.graph.adj
+        best = -1
+        for nb in adj[i]:
+            if dist[nb] >= 0 and (best < 0 or dist[nb] < dist[best]):
+                best = nb
+        if best < 0:
+            return  # still cut off from the target
+        dist[i] = dist[best] + 1
+        hop[i] = best
+        queue = deque([i])
+        while queue:
+            cur = queue.popleft()
+            self.work += 1
+            d = dist[cur] + 1
+            for nb in adj[cur]:
+                if dist[nb] < 0 or dist[nb] > d:
+                    dist[nb] = d
+                    hop[nb] = cur
+                    queue.append(nb)
+
+    def _closed(self, i: int) -> None:
+        # Only tiles whose path ran through i (its subtree of next hops) can
+        # get longer; everything else is still optimal. Reset the subtree,
+        # reseed it from its unaffected border and settle it in distance order.
+        dist, hop, adj, graph = self.dist, self.next_hop, self.graph.adj, self.graph
+        if dist[i] < 0:
+            return
+        subtree = [i]
+        dist[i] = hop[i] = -1
+        for cur in subtree:  # grows while we walk it
+            for nb in graph.around(cur):
+                if hop[nb] == cur and nb != cur:
+                    dist[nb] = hop[nb] = -1
+                    subtree.append(nb)
+        self.work += len(subtree)
+        heap = []
+        for cur in subtree:
+            for nb in adj[cur]:
+                if dist[nb] >= 0 and (dist[cur] < 0 or dist[nb] + 1 < dist[cur]):
+                    dist[cur] = dist[nb] + 1
+                    hop[cur] = nb
+            if dist[cur] >= 0:
+                heap.append((dist[cur], cur))
+        heapq.heapify(heap)
+        while heap:
+            d, cur = heapq.heappop(heap)
+            if d != dist[cur]:
+                continue  # stale entry
+            self.work += 1
+            for nb in adj[cur]:
+                if dist[nb] < 0 or dist[nb] > d + 1:
+                    dist[nb] = d + 1
+                    hop[nb] = cur
+                    heapq.heappush(heap, (d + 1, nb))
+
+
+class PathTable:
+    """All-pairs shortest paths over a maze's floor tiles, array-backed.
+
+    Floor tiles get dense ids; ``dist`` and ``hop`` are flat ``array('H')``
+    tables indexed ``src_id * floor_count + dst_id`` holding the path length
+    and the floor id of the first step from ``src`` towards ``dst``. Built
+    with one BFS per floor tile, so it is meant for fixed mazes up to
+    ``MAX_FLOOR`` tiles; ``load_or_build`` caches it on disk keyed by a hash
+    of the grid.
+    """
+
+    MAX_FLOOR = 1024  # 2 x 1024^2 x 2 bytes = 4 MiB, about half a second to build
+    CACHE_KEEP = 32  # newest tables kept on disk
+    UNREACHABLE = 0xFFFF
+    MAGIC = b"CCPT1"
+
+    def __init__(self, graph: MazeGraph, dist: array, hop: array):
+        self.graph = graph
+        self.tiles = array("i", (i for i in range(graph.size) if graph.floor[i]))
+        self.ids = array("i", [-1]) * graph.size
+        for fid, tile in enumerate(self.tiles):
+            self.ids[tile] = fid
+        self.count = len(self.tiles)
+        self.dist = dist
+        self.hop = hop
+        self._toward_dst = -1
+        self._toward = array("i")
+
+    @staticmethod
+    def grid_key(graph: MazeGraph) -> str:
+        h = hashlib.sha1()
+        h.update(struct.pack("<HH", graph.w, graph.h))
+        h.update(bytes(graph.floor))
+        return h.hexdigest()
+
+    @classmethod
+    def build(cls, graph: MazeGraph) -> "PathTable":
+        table = cls(graph, array("H"), array("H"))
+        n = table.count
+        if n > cls.MAX_FLOOR:
+            raise ValueError(f"{n} floor tiles is too many for an all-pairs table (max {cls.MAX_FLOOR})")
+        ids, tiles, adj = table.ids, table.tiles, graph.adj
+        dist = array("H", [cls.UNREACHABLE]) * (n * n)
+        hop = array("H", [cls.UNREACHABLE]) * (n * n)
+        # BFS from every destination; a node's BFS parent is its first step towards it
+        for dst in range(n):
+            dist[dst * n + dst] = 0
+            hop[dst * n + dst] = dst
+            queue = deque([tiles[dst]])
+            while queue:
+                cur = queue.popleft()
+                cid = ids[cur]
+                d = dist[cid * n + dst] + 1
+                for nb in adj[cur]:
+                    k = ids[nb] * n + dst
+                    if dist[k] == cls.UNREACHABLE:
+                        dist[k] = d
+                        hop[k] = cid
+                        queue.append(nb)
+        table.dist, table.hop = dist, hop
+        return table
+
+    @classmethod
+    def load_or_build(cls, graph: MazeGraph, cache_dir: Optional[Path]) -> "PathTable":
+        """Read the table for this grid from ``cache_dir``, building (and saving) it if absent."""
+        path = cache_dir / f"paths-{cls.grid_key(graph)}.bin" if cache_dir else None
+        if path is not None:
+            try:
+                data = path.read_bytes()
+                n = sum(graph.floor)
+                # Anything but the exact size (truncated, padded, other grid) is a miss
+                if (len(data) == 9 + 4 * n * n and data[:5] == cls.MAGIC
+                        and struct.unpack_from("<I", data, 5)[0] == n):
+                    table = cls(graph, array("H"), array("H"))
+                    table.dist.frombytes(data[9:9 + 2 * n * n])
+                    table.hop.frombytes(data[9 + 2 * n * n:])
+                    return table
+            except (OSError, ValueError, struct.error):
+                pass
+        table = cls.build(graph)
+        if path is not None:
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                # Write aside and swap in, so a reader never sees a partial table; the
+                # maze worker and take() may build the same grid at once, hence per-thread names
+                tmp = path.with_suffix(f".{os.getpid()}-{threading.get_ident()}.tmp")
+                tmp.write_bytes(cls.MAGIC + struct.pack("<I", table.count)
+                                + table.dist.tobytes() + table.hop.tobytes())
+                os.replace(tmp, path)
+                old = sorted(path.parent.glob("paths-*.bin"), key=lambda p: p.stat().st_mtime)
+                for stale in old[:-cls.CACHE_KEEP]:
+                    stale.unlink()
+            except OSError:
+                pass
+        return table
+
+    def distance(self, src: int, dst: int) -> int:
+        """Steps from tile ``src`` to tile ``dst`` (-1 if unreachable or not floor)."""
+        a, b = self.ids[src], self.ids[dst]
+        if a < 0 or b < 0:
+            return -1
+        d = self.dist[a * self.count + b]
+        return -1 if d == self.UNREACHABLE else d
+
+    def next_hop(self, src: int, dst: int) -> int:
+        """First tile on a shortest path from ``src`` to ``dst`` (-1 if none)."""
+        a, b = self.ids[src], self.ids[dst]
+        if a < 0 or b < 0:
+            return -1
+        h = self.hop[a * self.count + b]
+        return -1 if h == self.UNREACHABLE else self.tiles[h]
+
+    def toward(self, dst: int) -> array:
+        """Next tile towards ``dst`` for every tile (same shape as ``FlowField.next_hop``).
+
+        Sliced out of the ``dst`` column of the table and kept until the
+        target changes.
+        """
+        if dst != self._toward_dst:
+            out = array("i", [-1]) * self.graph.size
+            b = self.ids[dst] if 0 <= dst < self.graph.size else -1
+            if b >= 0:
+                tiles = self.tiles
+                for src, h in zip(tiles, self.hop[b::self.count]):
+                    if h != self.UNREACHABLE:
+                        out[src] = tiles[h]
+            self._toward_dst, self._toward = dst, out
+        return self._toward
+
+    def validate_path(self, tiles: list[int]) -> bool:
+        """True if consecutive tiles are all one legal step apart."""
+        return all(self.distance(a, b) == 1 for a, b in zip(tiles, tiles[1:]))
+
+
+class Sightlines:
+    """Line of sight per floor tile, as bitsets along its row and column.
+
+    Generated corridors are one tile wide and every (even, even) tile is
+    wall, so two tiles see each other exactly when they share a row or
+    column with only floor between them. ``row[i]`` has bit ``x`` set for
+    each tile of i's row it can see (within ``radius``), ``col[i]`` bit
+    ``y`` for its column; both are small ints regardless of maze size.
+    """
+
+    def __init__(self, graph: MazeGraph, radius: int):
+        self.graph = graph
+        self.radius = radius
+        self.row = [0] * graph.size
+        self.col = [0] * graph.size
+        for y in range(graph.h):
+            self._scan(y * graph.w, 1, graph.w, self.row)
+        for x in range(graph.w):
+            self._scan(x, graph.w, graph.h, self.col)
+
+    def _scan(self, first: int, stride: int, length: int, out: list[int]) -> None:
+        # one row (stride 1) or column (stride w) starting at tile ``first``
+        floor, r = self.graph.floor, self.radius
+        k = 0
+        while k < length:
+            if not floor[first + k * stride]:
+                out[first + k * stride] = 0
+                k += 1
+                continue
+            end = k
+            while end + 1 < length and floor[first + (end + 1) * stride]:
+                end += 1
+            for m in range(k, end + 1):
+                lo, hi = max(k, m - r), min(end, m + r)
+                out[first + m * stride] = ((1 << (hi - lo + 1)) - 1) << lo
+            k = end + 1
+
+    def update_cell(self, i: int) -> None:
+        """Rescan the row and column through ``i`` after ``graph.set_floor``."""
+        w = self.graph.w
+        self._scan(i - i % w, 1, w, self.row)
+        self._scan(i % w, w, self.graph.h, self.col)
+
+
+class Swarm:
+    """Enemy positions as struct-of-arrays over flat tile indices.
+
+    ``tile`` and ``prev`` hold every enemy's current and previous tile and
+    ``occupancy`` counts enemies per tile, so "is anyone on this tile" is a
+    single lookup however many enemies there are. With ``lines`` it also
+    keeps one occupancy bitset per row and column to AND with
+    ``Sightlines``.
+    """
+
+    def __init__(self, graph: MazeGraph, tiles: Iterable[int] = (), lines: bool = False):
+        self.graph = graph
+        self.tile = array("i", tiles)
+        self.prev = array("i", self.tile)
+        self.occupancy = array("H", [0]) * graph.size
+        self.row_bits: Optional[list[int]] = [0] * graph.h if lines else None
+        self.col_bits: Optional[list[int]] = [0] * graph.w if lines else None
+        for i in self.tile:
+            self._enter(i)
+
+    def _enter(self, i: int) -> None:
+        self.occupancy[i] += 1
+        if self.row_bits is not None and self.occupancy[i] == 1:
+            x, y = i % self.graph.w, i // self.graph.w
+            self.row_bits[y] |= 1 << x
+            self.col_bits[x] |= 1 << y
+
+    def _leave(self, i: int) -> None:
+        self.occupancy[i] -= 1
+        if self.row_bits is not None and self.occupancy[i] == 0:
+            x, y = i % self.graph.w, i // self.graph.w
+            self.row_bits[y] &= ~(1 << x)
+            self.col_bits[x] &= ~(1 << y)
+
+    def __len__(self) -> int:
+        return len(self.tile)
+
+    def occupied(self, i: int) -> bool:
+        return self.occupancy[i] > 0
+
+    def step(self, rng, next_hop: Sequence[int], wander: float = 0.2,
+             chase_until: Optional[Sequence[int]] = None, now: int = 0) -> None:
+        """Move every enemy one tile along ``next_hop``, or to a random neighbour with chance ``wander``.
+
+        With ``chase_until``, enemies whose entry is not past ``now`` patrol
+        instead: a random way on that does not turn back unless cornered.
+        """
+        tile, occ, adj = self.tile, self.occupancy, self.graph.adj
+        last = self.prev
+        self.prev = array("i", tile)
+        rand = rng.random
+        lines = self.row_bits is not None
+        for k, i in enumerate(tile):
+            r = rand()
+            if chase_until is not None and chase_until[k] <= now:
+                options = [j for j in adj[i] if j != last[k]] or adj[i]
+                if not options:
+                    continue
+                j = options[int(r * len(options))]
+            elif r < wander:
+                options = adj[i]
+                if not options:
+                    continue
+                # reuse the draw: r / wander is uniform on [0, 1)
+                j = options[min(len(options) - 1, int(r / wander * len(options)))]
+            else:
+                j = next_hop[i]
+                if j < 0:
+                    continue
+            if j != i:
+                tile[k] = j
+                if lines:
+                    self._leave(i)
+                    self._enter(j)
+                else:
+                    occ[i] -= 1
+                    occ[j] += 1
@@ -0,0 +1,150 @@
+"""
+Question sets for the Excel Fire Drill minigame.
+
+A run's questions are generated in one go from a seed and packed into a
+single ``array('h')``, four shorts per question (operator, a, b, answer), so
+the sheet can show every earlier row and a run can be replayed from its
+seed. ``balanced`` sets hold the same mix of operators and easy/hard
+questions, for tournaments; ``build`` writes a bank of them that
+``ProblemBank`` memory-maps and picks from by seed.
+
+Build a tournament bank (next to the scores file) with:
+    python excel_problems.py [SETS]
+"""
+from __future__ import annotations
+
+import os
+import random
+import struct
+import sys
+from array import array
+from pathlib import Path
+
+from mapped_bank import MappedBank
+
+SUM, DIFF, PROD, DIV = range(4)
+SYMBOLS = ("+", "-", "×", "÷")
+FIELDS = 4  # op, a, b, answer
+
+MAGIC = b"CCFD1"
+HEADER = struct.Struct("<5sHI")  # magic, questions per set, set count
+BANK_NAME = "problems.bin"
+DEFAULT_SETS = 1000
+
+
+def draw(rng: random.Random, op: int) -> tuple[int, int, int]:
+    """Operands and answer for one question of kind ``op``."""
+    if op == SUM:
+        a, b = rng.randint(5, 99), rng.randint(5, 99)
+        return a, b, a + b
+    if op == DIFF:
+        a, b = rng.randint(5, 99), rng.randint(5, 99)
+        return a, b, a - b
+    if op == PROD:
+        a, b = rng.randint(3, 12), rng.randint(3, 12)
+        return a, b, a * b
+    # division as inverted multiplication, so the result is always an integer
+    divisor, quotient = rng.randint(3, 12), rng.randint(3, 12)
+    return divisor * quotient, divisor, quotient
+
+
+def hard(op: int, a: int, b: int) -> bool:
+    """Carries, borrows, negative results and big products count as hard."""
+    if op == SUM:
+        return a % 10 + b % 10 >= 10
+    if op == DIFF:
+        return a < b or a % 10 < b % 10
+    if op == PROD:
+        return a * b >= 50
+    return a >= 50  # dividend
+
+
+class ProblemSet:
+    """One run's questions, packed four shorts per question."""
+
+    def __init__(self, data: array):
+        self.data = data
+
+    @classmethod
+    def generate(cls, seed: int, count: int, balanced: bool = False) -> "ProblemSet":
+        """``count`` questions from ``seed`` (same seed, same set).
+
+        Plain sets draw each operator at random; balanced ones cycle through
+        every (operator, easy/hard) pair before shuffling the order.
+        """
+        rng = random.Random(seed)
+        data = array("h")
+        if balanced:
+            slots = [(k % 4, k // 4 % 2 == 1) for k in range(count)]
+            rng.shuffle(slots)
+        else:
+            slots = [(rng.randrange(4), None) for _ in range(count)]
+        for op, want_hard in slots:
+            a, b, answer = draw(rng, op)
+            while want_hard is not None and hard(op, a, b) != want_hard:
+                a, b, answer = draw(rng, op)
+            data.extend((op, a, b, answer))
+        return cls(data)
+
+    def __len__(self) -> int:
+        return len(self.data) // FIELDS
+
+    def question(self, i: int) -> tuple[int, int, int, int]:
+        """(op, a, b, answer) of question ``i``."""
+        return tuple(self.data[i * FIELDS:(i + 1) * FIELDS])
+
+    def prompt(self, i: int) -> str:
+        op, a, b, _ = self.question(i)
+        return f"{a} {SYMBOLS[op]} {b} = ?"
+
+    def answer(self, i: int) -> int:
+        return self.data[i * FIELDS + 3]
+
+
+def set_seed(seed: int, i: int) -> int:
+    """Seed of set ``i`` in a bank built from ``seed`` (stable across runs and machines)."""
+    return random.Random(f"{seed}:{i}").getrandbits(32)
+
+
+def build(path: Path, sets: int = DEFAULT_SETS, count: int = 8, seed: int = 0,
+          balanced: bool = True) -> None:
+    """Write ``sets`` question sets of ``count`` questions to ``path`` (replaced atomically)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "wb") as f:
+        f.write(HEADER.pack(MAGIC, count, sets))
+        for i in range(sets):
+            f.write(ProblemSet.generate(set_seed(seed, i), count, balanced).data.tobytes())
+    os.replace(tmp, path)
+
+
+class ProblemBank(MappedBank):
+    """Read-only view of a bank file; ``pick`` is O(1)."""
+
+    MAGIC = MAGIC
+    HEADER = HEADER
+
+    def __init__(self, path: Path, count: int):
+        self.questions = count
+        super().__init__(path)
+
+    def _layout(self, path: Path, fields: list) -> tuple[int, int]:
+        n, sets = fields
+        if n != self.questions:
+            raise ValueError(f"{path} is not a bank of {self.questions}-question sets")
+        return n * FIELDS * array("h").itemsize, sets
+
+    def pick(self, seed: int) -> ProblemSet:
+        """Set ``seed % len(self)``."""
+        data = array("h")
+        data.frombytes(self.read(seed))
+        return ProblemSet(data)
+
+
+if __name__ == "__main__":
+    from game_common import SCORES_PATH, CACHE_DIRNAME, MATH_COUNT
+
+    target = SCORES_PATH.parent / CACHE_DIRNAME / BANK_NAME
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_SETS
+    build(target, total, MATH_COUNT)
+    print(f"wrote {total} balanced sets to {target}")
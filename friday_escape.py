@@ -3,13 +3,17 @@ Friday Escape minigame - Partner Pac-Man maze escape for Consulting Chaos.
 """
 from __future__ import annotations
 
+import math
 import random
 import time
-from typing import TYPE_CHECKING
+from array import array
+from typing import TYPE_CHECKING, Optional
 
+from escape_nav import FlowField, PathTable, Sightlines, Swarm
 from game_common import (
-    Scene, MinigameResult, CANVAS_W, CANVAS_H, BG, FG, ACCENT, GOOD, BAD, WARN, MUTED, CARD, GRID,
-    ESCAPE_ENEMIES, ESCAPE_TAG_PENALTY, ESCAPE_DECISION_INTERVAL
+    Scene, MinigameResult, build_start_overlay, CANVAS_W, CANVAS_H, BG, FG, ACCENT, GOOD, BAD, WARN, MUTED, CARD, GRID,
+    ESCAPE_ENEMIES, ESCAPE_TAG_PENALTY, ESCAPE_DECISION_INTERVAL, ESCAPE_GRID_W, ESCAPE_GRID_H, ESCAPE_DOORS,
+    ESCAPE_FOG
 )
 
 if TYPE_CHECKING:
@@ -23,6 +27,8 @@ class FridayEscape(Scene):
     ESCAPE_ENEMIES = ESCAPE_ENEMIES
     ESCAPE_TAG_PENALTY = ESCAPE_TAG_PENALTY
     ESCAPE_DECISION_INTERVAL = ESCAPE_DECISION_INTERVAL
+    DOORS = ESCAPE_DOORS
+    FOG = ESCAPE_FOG
     
     # Partner/MD quotes when they catch you
     PARTNER_QUOTES = [
@@ -48,9 +54,18 @@ class FridayEscape(Scene):
         "Quick question about the sustainability framework."
     ]
 
-    GRID_W = 15
-    GRID_H = 11
-    TILE = 36  # pixels
+    TILE = 36  # pixels, shrunk to fit bigger mazes
+    BOARD_Y = 90  # board area below the HUD
+
+    # Simulation runs in fixed steps of ESCAPE_DECISION_INTERVAL (one enemy
+    # move each); drawing interpolates between the last two steps.
+    SIM_STEP = ESCAPE_DECISION_INTERVAL
+    PLAYER_GLIDE = 0.08  # seconds for the player sprite to slide one tile
+    TIME_EPS = 1e-9  # summed dt drifts; don't let that shift a step by a frame
+    SMOOTH_ENEMIES = 200  # above this many partners, sprites jump tile to tile
+    NAV_BUDGET = 2000  # flow-field tiles expanded per frame on big mazes
+    DOOR_STEPS = 6  # sim steps between door changes
+    ALERT_STEPS = 6  # sim steps a partner keeps chasing after losing sight (fog)
 
     def __init__(self):
         self.started = False
@@ -58,110 +73,264 @@ class FridayEscape(Scene):
         self.end_time = 0.0
 
         self.grid = []  # 0 floor, 1 wall
+        self.grid_w = ESCAPE_GRID_W
+        self.grid_h = ESCAPE_GRID_H
         self.start = (1, 1)
-        self.exit = (self.GRID_W - 2, self.GRID_H - 2)
+        self.exit = (self.grid_w - 2, self.grid_h - 2)
 
         self.player = (1, 1)
-        self.enemies: list[tuple[int, int]] = []
-        self.enemy_timer = 0.0
+        self.swarm: Optional[Swarm] = None  # partner positions, built with the maze
+        self._drawn = array("i")  # tile each partner sprite was last drawn on
+        self.enemy_timer = 0.0  # sim accumulator: time not yet consumed by a step
+        # previous tile, for render interpolation
+        self.player_prev = (1, 1)
+        self.player_glide = 0.0
+        self.nav: Optional[FlowField] = None  # built per maze in on_enter
+        self.paths: Optional[PathTable] = None  # all-pairs table, when the maze is small enough
+        self.exit_nav: Optional[FlowField] = None  # towards the exit, for hints without a table
+        self.doors: list[int] = []  # tiles that open and close mid-run
+        self.steps = 0  # sim steps taken
+        self.sight: Optional[Sightlines] = None  # fog-of-war line of sight
+        self.chase_until = array("l")  # per partner: chases while steps < this (fog)
+        self._fog_key: Optional[tuple] = None  # (player, steps) the fog was last drawn for
+        self.show_hint = False
+        self.trail: list[list[int]] = [[]]  # player tiles, one segment per respawn
         self.tags = 0
         self.invuln = 0.0  # seconds after tag
 
-        # drawing origin
-        self.x0 = (CANVAS_W - self.GRID_W * self.TILE) // 2
-        self.y0 = 90
+        # drawing origin and tile size, fitted to the maze in on_enter
+        self.tile: float = self.TILE
+        self.x0 = 0.0
+        self.y0 = self.BOARD_Y
 
     # -------- timing helpers --------
     def elapsed(self) -> float:
-        end = self.end_time if self.end_time else time.perf_counter()
+        end = self.end_time if self.end_time else self.clock.now()
         return max(0.0, end - self.start_time) if self.started else 0.0
 
-    # -------- fixed Pac-Man style maze --------
-    def _gen_maze(self, rng: random.Random) -> None:
-        # Fixed Pac-Man style maze with multiple paths
-        # 0 = floor, 1 = wall
-        self.grid = [
-            [1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],  # 0
-            [1,0,0,0,0,0,0,1,0,0,0,0,0,0,1],  # 1
-            [1,0,1,1,0,1,0,1,0,1,0,1,1,0,1],  # 2
-            [1,0,0,0,0,0,0,0,0,0,0,0,0,0,1],  # 3
-            [1,0,1,0,1,1,1,1,1,1,1,0,1,0,1],  # 4
-            [1,0,0,0,0,0,0,0,0,0,0,0,0,0,1],  # 5
-            [1,0,1,0,1,1,1,1,1,1,1,0,1,0,1],  # 6
-            [1,0,0,0,0,0,0,0,0,0,0,0,0,0,1],  # 7
-            [1,0,1,1,0,1,0,1,0,1,0,1,1,0,1],  # 8
-            [1,0,0,0,0,0,0,1,0,0,0,0,0,0,1],  # 9
-            [1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],  # 10
-        ]
-        
-        self.start = (1, 1)
-        self.exit = (13, 9)
+    # -------- procedural maze --------
+    def _gen_maze(self, app: "GameApp") -> None:
+        # Mazes come from the app's bank, seeded from app.rng
+        maze = app.mazes.take()
+        self.grid = maze.grid
+        self.grid_w, self.grid_h = maze.graph.w, maze.graph.h
+        self.start = maze.start
+        self.exit = maze.exit
         self.player = self.start
+        self.nav = FlowField(maze.graph)
+        self.paths = maze.paths
+        self.sight = None
+        if self.FOG:
+            ok = maze.sight is not None and maze.sight.radius == self.FOG
+            self.sight = maze.sight if ok else Sightlines(maze.graph, self.FOG)
+        self._spawn_enemies(app.rng)
+        self.doors = self._place_doors(app.rng) if self.DOORS else []
+        # The all-pairs table describes the maze as generated; once doors
+        # move, partners and hints use flow fields that are repaired in place.
+        self.exit_nav = None
+        if self.doors or self.paths is None:
+            self.exit_nav = FlowField(maze.graph)
+            self.exit_nav.retarget(maze.graph.index(self.exit))
+
+        # fit the board into the canvas below the HUD
+        self.tile = min(self.TILE, (CANVAS_W - 40) / self.grid_w, (CANVAS_H - self.BOARD_Y - 10) / self.grid_h)
+        self.x0 = (CANVAS_W - self.grid_w * self.tile) / 2
+        self.y0 = self.BOARD_Y
 
-        # Place enemies at strategic positions with multiple paths
-        self.enemies = [
-            (7, 3), (7, 7),  # Center column (2 enemies)
-            (3, 5), (11, 5),  # Side positions (2 enemies)
+    def _spawn_enemies(self, rng: random.Random) -> None:
+        """Place ESCAPE_ENEMIES on random floor tiles away from the start."""
+        graph = self.nav.graph
+        sx, sy = self.start
+        spots = [
+            i
+            for i in range(graph.size)
+            if graph.floor[i] and abs(i % graph.w - sx) + abs(i // graph.w - sy) > 4
         ]
+        tiles = [rng.choice(spots) for _ in range(self.ESCAPE_ENEMIES)] if spots else []
+        self.swarm = Swarm(graph, tiles, lines=self.sight is not None)
+        self.chase_until = array("l", [0]) * len(tiles)
+
+    def _place_doors(self, rng: random.Random) -> list[int]:
+        """Pick straight corridor tiles, clear of the start, exit and partners, as doors."""
+        graph = self.nav.graph
+        sx, sy = self.start
+        ends = (graph.index(self.start), graph.index(self.exit))
+        spots = []
+        for i in range(graph.size):
+            a = graph.adj[i]
+            if (len(a) == 2 and a[0] - i == i - a[1] and i not in ends
+                    and not self.swarm.occupied(i) and abs(i % graph.w - sx) + abs(i // graph.w - sy) > 2):
+                spots.append(i)
+        return rng.sample(spots, min(self.DOORS, len(spots)))
+
+    def _toggle_door(self, app: "GameApp") -> None:
+        """A meeting room gets booked (door shuts) or freed (door opens)."""
+        graph = self.nav.graph
+        i = app.rng.choice(self.doors)
+        closing = bool(graph.floor[i])
+        if closing and (self.swarm.occupied(i) or i == graph.index(self.player)):
+            return  # someone is standing in the doorway
+        t0 = time.perf_counter()
+        graph.set_floor(i, not closing)
+        self.exit_nav.update_cell(i)
+        if closing and min(self.exit_nav.dist[graph.index(self.player)],
+                           self.exit_nav.dist[graph.index(self.start)]) < 0:
+            # the door is the last way out for the player (or a respawn): keep it open
+            graph.set_floor(i, True)
+            self.exit_nav.update_cell(i)
+            self.replan_s += time.perf_counter() - t0
+            return
+        x, y = graph.pos(i)
+        self.grid[y][x] = 1 if closing else 0
+        self.nav.update_cell(i)
+        if self.sight is not None:
+            self.sight.update_cell(i)
+        self.replan_s += time.perf_counter() - t0
+
+    def _spot(self, target: int) -> None:
+        """Partners with the player in sight chase for the next ALERT_STEPS steps."""
+        graph, swarm, sight = self.nav.graph, self.swarm, self.sight
+        px, py = graph.pos(target)
+        # tiles that see the player AND hold a partner, one row and one column
+        rows = sight.row[target] & swarm.row_bits[py]
+        cols = sight.col[target] & swarm.col_bits[px]
+        if not (rows or cols):
+            return
+        until = self.steps + self.ALERT_STEPS
+        w = graph.w
+        for k, i in enumerate(swarm.tile):
+            x, y = i % w, i // w
+            if (y == py and rows >> x & 1) or (x == px and cols >> y & 1):
+                self.chase_until[k] = until
 
     # -------- drawing helpers --------
-    def _draw_grid(self, c) -> None:
-        for y in range(self.GRID_H):
-            for x in range(self.GRID_W):
-                X = self.x0 + x * self.TILE
-                Y = self.y0 + y * self.TILE
-                if self.grid[y][x] == 1:
-                    c.create_rectangle(X, Y, X + self.TILE, Y + self.TILE, fill=GRID, width=0)
-                else:
-                    c.create_rectangle(X, Y, X + self.TILE, Y + self.TILE, fill=CARD, width=0)
+    def _build_grid(self, v) -> None:
+        # The maze is fixed per run, so bake it once: one floor rectangle,
+        # then each horizontal run of wall becomes a single rectangle.
+        t = self.tile
+        v.rect("maze", self.x0, self.y0, self.x0 + self.grid_w * t, self.y0 + self.grid_h * t,
+               fill=CARD, width=0)
+        for y in range(self.grid_h):
+            row = self.grid[y]
+            Y = self.y0 + y * t
+            x = 0
+            while x < self.grid_w:
+                end = x + 1
+                while end < self.grid_w and row[end] == row[x]:
+                    end += 1
+                if row[x] == 1:
+                    v.rect(f"maze{x}.{y}", self.x0 + x * t, Y, self.x0 + end * t, Y + t,
+                           fill=GRID, width=0)
+                x = end
+        if self.sight is not None:
+            # fog over the board; the player's sight lines are cut out of it.
+            # Created before the markers, doors and sprites so it never covers them
+            v.rect("fog", self.x0, self.y0, self.x0 + self.grid_w * t, self.y0 + self.grid_h * t,
+                   fill=BG, stipple="gray50", width=0)
+            v.rect("lit.row", 0, 0, 0, 0, fill=CARD, width=0)
+            v.rect("lit.col", 0, 0, 0, 0, fill=CARD, width=0)
+            self._fog_key = None
         # start / exit
         sx, sy = self.start
         ex, ey = self.exit
-        c.create_rectangle(self.x0 + sx * self.TILE + 6, self.y0 + sy * self.TILE + 6,
-                           self.x0 + (sx + 1) * self.TILE - 6, self.y0 + (sy + 1) * self.TILE - 6,
-                           fill=GOOD, width=0)
-        c.create_rectangle(self.x0 + ex * self.TILE + 6, self.y0 + ey * self.TILE + 6,
-                           self.x0 + (ex + 1) * self.TILE - 6, self.y0 + (ey + 1) * self.TILE - 6,
-                           outline=ACCENT, width=3)
-
-    def _draw_entity(self, c, pos: tuple[int, int], color: str) -> None:
+        pad = t / 6
+        v.rect("start", self.x0 + sx * t + pad, self.y0 + sy * t + pad,
+               self.x0 + (sx + 1) * t - pad, self.y0 + (sy + 1) * t - pad,
+               fill=GOOD, width=0)
+        v.rect("exit", self.x0 + ex * t + pad, self.y0 + ey * t + pad,
+               self.x0 + (ex + 1) * t - pad, self.y0 + (ey + 1) * t - pad,
+               outline=ACCENT, width=max(1, round(t / 12)))
+
+    def _place_entity(self, v, key: str, pos: tuple[int, int], color: str,
+                      prev: Optional[tuple[int, int]] = None, t: float = 1.0) -> None:
+        """Put an entity's sprite ``t`` of the way from ``prev`` to ``pos`` (tile units)."""
         x, y = pos
-        X = self.x0 + x * self.TILE + self.TILE // 2
-        Y = self.y0 + y * self.TILE + self.TILE // 2
+        px, py = prev if prev is not None else pos
+        X = self.x0 + (px + (x - px) * t + 0.5) * self.tile
+        Y = self.y0 + (py + (y - py) * t + 0.5) * self.tile
         
-        # Use emojis instead of circles
+        if key in v:
+            v.move(key, X, Y)
+            return
+
+        # Use emojis instead of circles, picked once when the sprite is made
         if color == BAD:  # Partner/MD emojis
             partner_emojis = ["👨‍💼", "👩‍💼", "🧑‍💼"]
             emoji = partner_emojis[hash((x, y)) % len(partner_emojis)]
         else:  # Player emoji (worried face)
             emoji = "😰"
-        
-        c.create_text(X, Y, text=emoji, font=("TkDefaultFont", 20), fill=color)
+        size = max(4, round(20 * self.tile / self.TILE))
+        v.text(key, X, Y, text=emoji, font=("TkDefaultFont", size), fill=color)
 
     # -------- logic helpers --------
     def _is_wall(self, x: int, y: int) -> bool:
-        if not (0 <= x < self.GRID_W and 0 <= y < self.GRID_H):
+        if not (0 <= x < self.grid_w and 0 <= y < self.grid_h):
             return True
         return self.grid[y][x] == 1
 
-    def _neighbors4(self, x: int, y: int):
-        for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
-            nx, ny = x + dx, y + dy
-            if not self._is_wall(nx, ny):
-                yield nx, ny
-
-    def _enemy_step(self, rng: random.Random, target: tuple[int, int], pos: tuple[int, int]) -> tuple[int, int]:
-        # Greedy Manhattan with a bit of randomness
-        px, py = pos
-        tx, ty = target
-        options = list(self._neighbors4(px, py))
-        if not options:
-            return pos
-        # 20% random move to add spice
-        if rng.random() < 0.2:
-            return rng.choice(options)
-        best = min(options, key=lambda p: abs(p[0] - tx) + abs(p[1] - ty))
-        return best
+    def _sim_step(self, app: "GameApp") -> None:
+        """Advance doors and every partner by one fixed step."""
+        self.steps += 1
+        if self.doors and self.steps % self.DOOR_STEPS == 0:
+            self._toggle_door(app)
+        t0 = time.perf_counter()
+        target = self.nav.graph.index(self.player)
+        if self.paths is not None and not self.doors:
+            next_hop = self.paths.toward(target)
+        elif self.paths is not None:
+            # small maze with doors: the field is cheap enough to rebuild now
+            self.nav.retarget(target)
+            next_hop = self.nav.next_hop
+        else:
+            # Too big for the table: one BFS per player move, shared by every
+            # enemy and spread over the frames between steps. Partners chase
+            # where the player was last step; finishing here keeps that
+            # independent of frame rate.
+            self.nav.advance(math.inf)
+            next_hop = self.nav.next_hop
+        chase = None
+        if self.sight is not None:
+            self._spot(target)
+            chase = self.chase_until  # the rest patrol
+        self.replan_s += time.perf_counter() - t0
+        # follow the shortest path, with a 20% random move to add spice
+        self.swarm.step(app.rng, next_hop, wander=0.2, chase_until=chase, now=self.steps)
+        if self.paths is None:
+            self.nav.begin(target)
+
+    def _hint_step(self) -> Optional[tuple[int, int]]:
+        """Next tile on the shortest way from the player to the exit."""
+        graph = self.nav.graph
+        if self.exit_nav is not None:
+            hop = self.exit_nav.next_hop[graph.index(self.player)]
+        else:
+            hop = self.paths.next_hop(graph.index(self.player), graph.index(self.exit))
+        return graph.pos(hop) if hop >= 0 else None
+
+    def replay_valid(self) -> bool:
+        """Check the recorded trail: every move one legal step, ending on the exit."""
+        graph = self.nav.graph
+        if self.paths is not None:
+            steps_ok = all(self.paths.validate_path(seg) for seg in self.trail)
+        else:
+            # no table: each step goes to an orthogonal neighbour that is floor
+            # (or a door, which may have shut since the player walked through)
+            doors = set(self.doors)
+            steps_ok = all(b in graph.around(a) and (graph.floor[b] or b in doors)
+                           for seg in self.trail for a, b in zip(seg, seg[1:]))
+        return steps_ok and self.trail[-1][-1:] == [graph.index(self.exit)]
+
+    def _check_tag(self, app: "GameApp") -> None:
+        if self.invuln <= self.TIME_EPS and self.swarm.occupied(self.nav.graph.index(self.player)):
+            self.tags += 1
+            self.player = self.start  # respawn
+            self.trail.append([self.nav.graph.index(self.start)])
+            self.player_prev = self.start
+            self.player_glide = 0.0
+            self.invuln = 1.0
+            # Show a random partner quote
+            quote = app.rng.choice(self.PARTNER_QUOTES)
+            app.toasts.add(f"Partner: \"{quote}\" +{self.ESCAPE_TAG_PENALTY:.1f}s")
 
     # -------- lifecycle --------
     def on_enter(self, app: "GameApp") -> None:
@@ -171,96 +340,99 @@ class FridayEscape(Scene):
         self.tags = 0
         self.invuln = 0.0
         self.enemy_timer = 0.0
-        self._gen_maze(app.rng)
+        self.steps = 0
+        self._gen_maze(app)
+        if self.paths is None or self.doors:
+            self.nav.retarget(self.nav.graph.index(self.player))
+        self.trail = [[self.nav.graph.index(self.player)]]
+        self.show_hint = False
+        self.player_prev = self.player
+        self.player_glide = 0.0
+        self._build()
 
     def update(self, app: "GameApp", dt: float) -> None:
-        app.toasts.update(dt)
+        if app.toasts.update(dt):
+            self.invalidate()
         if not self.started:
             return
+        # Timer, enemies and the invulnerability blink all move while running
+        self.invalidate()
         if self.invuln > 0:
             self.invuln = max(0.0, self.invuln - dt)
+        self.player_glide = max(0.0, self.player_glide - dt)
 
-        # enemies think on a fixed cadence
+        # enemies think on a fixed step; the remainder carries over
         self.enemy_timer += dt
-        if self.enemy_timer >= self.ESCAPE_DECISION_INTERVAL:
-            self.enemy_timer = 0.0
-            self.enemies = [self._enemy_step(app.rng, self.player, e) for e in self.enemies]
-
-        # collision check
-        if self.invuln <= 0 and any(e == self.player for e in self.enemies):
-            self.tags += 1
-            self.player = self.start  # respawn
-            self.invuln = 1.0
-            # Show a random partner quote
-            quote = app.rng.choice(self.PARTNER_QUOTES)
-            app.toasts.add(f"Partner: \"{quote}\" +{self.ESCAPE_TAG_PENALTY:.1f}s")
+        while self.enemy_timer >= self.SIM_STEP - self.TIME_EPS:
+            self.enemy_timer -= self.SIM_STEP
+            self._sim_step(app)
+            self._check_tag(app)
+        self._check_tag(app)
+        if self.paths is None:
+            t0 = time.perf_counter()
+            self.nav.advance(self.NAV_BUDGET)
+            self.replan_s += time.perf_counter() - t0
 
         # win?
         if self.player == self.exit:
             # Show escape success message
             app.toasts.add("🎉 You escaped! Enjoy your weekend... but only for now... 😈")
-            self.end_time = time.perf_counter()
+            self.end_time = self.clock.now()
             pen = self.tags * self.ESCAPE_TAG_PENALTY
+            graph = self.nav.graph
+            shortest = self.paths.distance(graph.index(self.start), graph.index(self.exit)) if self.paths else -1
             result = MinigameResult(
                 name=self.name,
                 elapsed=self.elapsed(),
                 penalty=pen,
-                detail={"tags": self.tags},
+                detail={"tags": self.tags, "moves": sum(len(seg) - 1 for seg in self.trail),
+                        "shortest": shortest, "valid": self.replay_valid()},
             )
             app.run_results.append(result)
             from scenes import Results
             app.scenes.switch(Results(app.run_results))
 
-    def draw(self, app: "GameApp", c) -> None:
-        c.delete("all")
-        c.create_rectangle(0, 0, CANVAS_W, CANVAS_H, fill=BG, width=0)
+    def _build(self) -> None:
+        v = self.view
+        v.rect("bg", 0, 0, CANVAS_W, CANVAS_H, fill=BG, width=0)
 
         # HUD
-        c.create_text(20, 20, text=self.name, fill=ACCENT, font=("TkDefaultFont", 18, "bold"), anchor="nw")
+        v.text("header", 20, 20, text=self.name, fill=ACCENT, font=("TkDefaultFont", 18, "bold"), anchor="nw")
         
-        # Instructions summary (top left)
-        if self.started:
-            c.create_text(
-                20,
-                50,
-                text="Arrows: move • Avoid Partners/MDs • Reach EXIT",
-                fill=MUTED,
-                font=("TkDefaultFont", 10),
-                anchor="nw",
-            )
+        # Instructions summary (top left, shown once started)
+        v.text(
+            "hint",
+            20,
+            50,
+            text="Arrows: move • H: hint • Avoid Partners/MDs • Reach EXIT",
+            fill=MUTED,
+            font=("TkDefaultFont", 10),
+            anchor="nw",
+            state="hidden",
+        )
         
-        c.create_text(CANVAS_W - 20, 20, text=f"Time: {self.elapsed():.2f}s", fill=FG,
-                      font=("TkDefaultFont", 14, "bold"), anchor="ne")
-        c.create_text(CANVAS_W - 20, 44, text=f"Tags: {self.tags} (x {self.ESCAPE_TAG_PENALTY:.1f}s)",
-                      fill=WARN, font=("TkDefaultFont", 12), anchor="ne")
-
-        self._draw_grid(c)
-        # draw enemies
-        for e in self.enemies:
-            self._draw_entity(c, e, BAD)
-        # draw player (blink when invuln)
-        if self.invuln <= 0 or int(self.invuln * 10) % 2 == 0:
-            self._draw_entity(c, self.player, ACCENT)
+        v.text("timer", CANVAS_W - 20, 20, text="", fill=FG,
+               font=("TkDefaultFont", 14, "bold"), anchor="ne")
+        v.text("tags", CANVAS_W - 20, 44, text="",
+               fill=WARN, font=("TkDefaultFont", 12), anchor="ne")
+
+        self._build_grid(v)
+        graph, t = self.nav.graph, self.tile
+        for k, i in enumerate(self.doors):
+            x, y = graph.pos(i)
+            v.rect(f"door{k}", self.x0 + x * t + 1, self.y0 + y * t + 1, self.x0 + (x + 1) * t - 1,
+                   self.y0 + (y + 1) * t - 1, fill=WARN, width=0, state="hidden")
+        for k, i in enumerate(self.swarm.tile):
+            self._place_entity(v, f"enemy{k}", graph.pos(i), BAD)
+        self._drawn = array("i", self.swarm.tile)
+        self._place_entity(v, "player", self.player, ACCENT)
+        v.line("arrow", 0, 0, 0, 0, fill=GOOD, width=max(1, round(self.tile / 12)), arrow="last", state="hidden")
 
         # overlay
-        if not self.started:
-            # BCG-style professional overlay
-            c.create_rectangle(0, 0, CANVAS_W, CANVAS_H, fill="#1a1a2e", stipple="gray25", width=0)
-            
-            # Header section
-            c.create_rectangle(40, 80, CANVAS_W - 40, 120, fill="#0f3460", width=2, outline="#4a90e2")
-            c.create_text(
-                CANVAS_W // 2,
-                100,
-                text="BCG OFFICE POLITICS NAVIGATION ASSESSMENT",
-                fill="#4a90e2",
-                font=("TkDefaultFont", 16, "bold"),
-            )
-            
-            # Main content box
-            c.create_rectangle(60, 140, CANVAS_W - 60, 400, fill="#2c3e50", width=2, outline="#34495e")
-            
-            lines = [
+        build_start_overlay(
+            v,
+            "BCG OFFICE POLITICS NAVIGATION ASSESSMENT",
+            [
                 "STRATEGIC SITUATION:",
                 "It's Friday 4:59 PM. Navigate office politics",
                 "and escape before Partners/MDs catch you leaving early!",
@@ -275,27 +447,65 @@ class FridayEscape(Scene):
                 "Arrows move. Tagging adds +2.0s and sends you back.",
                 "",
                 "Press Enter to Begin Assessment"
-            ]
-            c.create_text(
-                CANVAS_W // 2,
-                270,
-                text="\n".join(lines),
-                fill="#ecf0f1",
-                font=("TkDefaultFont", 12),
-                justify="center",
-            )
-            
-            # Professional call-to-action button
-            c.create_rectangle(CANVAS_W // 2 - 150, 420, CANVAS_W // 2 + 150, 460, fill="#e74c3c", width=0)
-            c.create_text(
-                CANVAS_W // 2,
-                440,
-                text="BEGIN NAVIGATION ASSESSMENT",
-                fill="#ffffff",
-                font=("TkDefaultFont", 12, "bold"),
-            )
+            ],
+            "BEGIN NAVIGATION ASSESSMENT",
+        )
+
+    def draw(self, app: "GameApp", c) -> None:
+        v = self.view
+        v.show("hint", self.started)
+        v.config("timer", text=f"Time: {self.elapsed():.2f}s")
+        v.config("tags", text=f"Tags: {self.tags} (x {self.ESCAPE_TAG_PENALTY:.1f}s)")
+
+        graph, swarm = self.nav.graph, self.swarm
+        for k, i in enumerate(self.doors):
+            v.show(f"door{k}", not graph.floor[i])
+        if len(swarm) <= self.SMOOTH_ENEMIES:
+            # enemies glide between their last two sim steps
+            alpha = self.enemy_timer / self.SIM_STEP
+            for k, (i, prev) in enumerate(zip(swarm.tile, swarm.prev)):
+                self._place_entity(v, f"enemy{k}", graph.pos(i), BAD, graph.pos(prev), alpha)
+        else:
+            # crowds snap to their tile, and only sprites that moved are touched
+            drawn = self._drawn
+            for k, i in enumerate(swarm.tile):
+                if drawn[k] != i:
+                    drawn[k] = i
+                    self._place_entity(v, f"enemy{k}", graph.pos(i), BAD)
+        # player slides into the tile it just moved to (blink when invuln)
+        glide = 1.0 - self.player_glide / self.PLAYER_GLIDE
+        self._place_entity(v, "player", self.player, ACCENT, self.player_prev, glide)
+        v.show("player", self.invuln <= 0 or int(self.invuln * 10) % 2 == 0)
+        if self.sight is not None and self._fog_key != (self.player, self.steps):
+            self._fog_key = (self.player, self.steps)
+            self._draw_fog(v)
+
+        # hint: arrow from the player towards the next tile on the way out
+        step = self._hint_step() if self.show_hint else None
+        v.show("arrow", step is not None)
+        if step is not None:
+            t = self.tile
+            (px, py), (nx, ny) = self.player, step
+            X, Y = self.x0 + (px + 0.5) * t, self.y0 + (py + 0.5) * t
+            v.move("arrow", X, Y, X + (nx - px) * t * 0.9, Y + (ny - py) * t * 0.9)
 
-        app.toasts.draw(c)
+        v.show_group("overlay", not self.started)
+        app.toasts.draw(v)
+
+    def _draw_fog(self, v) -> None:
+        """Light the player's row and column of sight; hide partners outside them."""
+        graph, sight, t = self.nav.graph, self.sight, self.tile
+        p = graph.index(self.player)
+        px, py = self.player
+        row, col = sight.row[p], sight.col[p]
+        lo, hi = (row & -row).bit_length() - 1, row.bit_length()
+        v.move("lit.row", self.x0 + lo * t, self.y0 + py * t, self.x0 + hi * t, self.y0 + (py + 1) * t)
+        lo, hi = (col & -col).bit_length() - 1, col.bit_length()
+        v.move("lit.col", self.x0 + px * t, self.y0 + lo * t, self.x0 + (px + 1) * t, self.y0 + hi * t)
+        w = graph.w
+        for k, i in enumerate(self.swarm.tile):
+            x, y = i % w, i // w
+            v.show(f"enemy{k}", bool((y == py and row >> x & 1) or (x == px and col >> y & 1)))
 
     def handle_key(self, app: "GameApp", e) -> None:
         if e.keysym == "Escape":
@@ -304,7 +514,11 @@ class FridayEscape(Scene):
         if not self.started:
             if e.keysym in ("Return", "space"):
                 self.started = True
-                self.start_time = time.perf_counter()
+                self.start_time = self.clock.now()
+            return
+
+        if e.keysym in ("h", "H"):
+            self.show_hint = not self.show_hint
             return
 
         # movement (tile-by-tile)
@@ -313,4 +527,7 @@ class FridayEscape(Scene):
         if (dx, dy) != (0, 0):
             nx, ny = self.player[0] + dx, self.player[1] + dy
             if not self._is_wall(nx, ny):
+                self.player_prev = self.player
                 self.player = (nx, ny)
+                self.player_glide = self.PLAYER_GLIDE
+                self.trail[-1].append(self.nav.graph.index(self.player))
@@ -4,16 +4,20 @@ Shared utilities and base classes for Consulting Chaos game.
 from __future__ import annotations
 
 import json
+import math
 import random
 import time
+from array import array
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Callable
+from typing import Optional, Callable, Protocol
 
 try:
     import tkinter as tk
-except Exception as e:  # pragma: no cover
-    raise SystemExit("tkinter is required to run this game.\n" + str(e))
+except Exception:  # pragma: no cover
+    # Headless boxes (CI, benchmarks) can still run scenes on a RecordingCanvas;
+    # GameApp refuses to open a window without tkinter.
+    tk = None
 
 # ------------------------------
 # Config & Theme
@@ -33,6 +37,8 @@ MUTED = "#81c784"  # Muted green
 CARD = "#2E7D32"  # Green cards
 
 EMAIL_PENALTY_PER_MISS = 0.3
+EMAIL_TEXT_CHARS = 160  # exact prompt length, so every run types the same amount
+EMAIL_DOC_CHARS = 0  # long-form client memo length in characters (0: one short prompt)
 MATH_COUNT = 8
 MATH_WRONG_PENALTY = 1.0
 
@@ -45,8 +51,13 @@ CAL_LEFTOVER_PENALTY = 1.0
 ESCAPE_ENEMIES = 4
 ESCAPE_TAG_PENALTY = 2.0
 ESCAPE_DECISION_INTERVAL = 0.5
+ESCAPE_GRID_W, ESCAPE_GRID_H = 15, 11  # tiles; odd, up to 255
+ESCAPE_LOOPS = 0.5  # chance of an extra passage per corridor run
+ESCAPE_DOORS = 0  # meeting-room doors that open/close mid-run (0: static maze)
+ESCAPE_FOG = 0  # fog-of-war sight radius in tiles (0: off)
 
 SCORES_PATH = Path(__file__).parent / "consulting_chaos.scores.json"
+CACHE_DIRNAME = "consulting_chaos.cache"  # created next to the scores file
 
 JARGON = [
     "Let's circle back post-standup.",
@@ -136,11 +147,166 @@ class HighScoreManager:
             pass
 
 
+# ------------------------------
+# Retained-mode drawing
+# ------------------------------
+class CanvasLike(Protocol):
+    """The subset of ``tk.Canvas`` that scenes draw through (via View)."""
+
+    def create_rectangle(self, *coords: float, **opts) -> int: ...
+    def create_text(self, *coords: float, **opts) -> int: ...
+    def create_line(self, *coords: float, **opts) -> int: ...
+    def create_oval(self, *coords: float, **opts) -> int: ...
+    def create_polygon(self, *coords: float, **opts) -> int: ...
+    def delete(self, *items) -> None: ...
+    def itemconfig(self, item, **opts) -> None: ...
+    def coords(self, item, *coords: float): ...
+
+
+_MISSING = object()
+
+
+class View:
+    """Keyed canvas items that are created once and then updated in place.
+
+    Scenes build their items in ``on_enter`` and change them per frame with
+    ``config``/``move``; both skip the Tk call when nothing actually changed,
+    so a frame only costs as much as what changed on screen.
+    """
+
+    def __init__(self, c: CanvasLike):
+        self.c = c
+        self.items: dict[str, int] = {}
+        self._opts: dict[str, dict] = {}
+        self._coords: dict[str, tuple] = {}
+        self._groups: dict[str, list[str]] = {}  # "overlay" -> ["overlay.shade", ...]
+
+    def add(self, key: str, kind: str, *coords: float, **opts) -> int:
+        """Create a ``kind`` item (rectangle, text, line, ...) under ``key``."""
+        if key in self.items:
+            self.c.delete(self.items[key])
+        item = getattr(self.c, f"create_{kind}")(*coords, **opts)
+        if key not in self.items:
+            self._groups.setdefault(key.split(".", 1)[0], []).append(key)
+        self.items[key] = item
+        self._opts[key] = dict(opts)
+        self._coords[key] = coords
+        return item
+
+    def rect(self, key: str, *coords: float, **opts) -> int:
+        return self.add(key, "rectangle", *coords, **opts)
+
+    def text(self, key: str, *coords: float, **opts) -> int:
+        return self.add(key, "text", *coords, **opts)
+
+    def line(self, key: str, *coords: float, **opts) -> int:
+        return self.add(key, "line", *coords, **opts)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.items
+
+    def config(self, key: str, **opts) -> None:
+        """``itemconfig`` only the options that differ from what is on screen."""
+        cached = self._opts[key]
+        changed = {k: v for k, v in opts.items() if cached.get(k, _MISSING) != v}
+        if changed:
+            cached.update(changed)
+            self.c.itemconfig(self.items[key], **changed)
+
+    def move(self, key: str, *coords: float) -> None:
+        """``coords`` the item only if its geometry changed."""
+        if self._coords[key] != coords:
+            self._coords[key] = coords
+            self.c.coords(self.items[key], *coords)
+
+    def show(self, key: str, visible: bool = True) -> None:
+        self.config(key, state="normal" if visible else "hidden")
+
+    def show_group(self, group: str, visible: bool = True) -> None:
+        """Show or hide ``group`` and every ``group.*`` item."""
+        for key in self._groups.get(group, ()):
+            self.show(key, visible)
+
+    def clear(self) -> None:
+        self.c.delete("all")
+        self.items.clear()
+        self._opts.clear()
+        self._coords.clear()
+        self._groups.clear()
+
+
+
+def build_start_overlay(view: View, title: str, lines: list[str], button: str) -> None:
+    """The shared "press Enter to begin" briefing used by every minigame."""
+    # BCG-style professional overlay
+    view.rect("overlay.shade", 0, 0, CANVAS_W, CANVAS_H, fill="#1a1a2e", stipple="gray25", width=0)
+
+    # Header section
+    view.rect("overlay.header", 40, 80, CANVAS_W - 40, 120, fill="#0f3460", width=2, outline="#4a90e2")
+    view.text(
+        "overlay.title",
+        CANVAS_W // 2,
+        100,
+        text=title,
+        fill="#4a90e2",
+        font=("TkDefaultFont", 16, "bold"),
+    )
+
+    # Main content box
+    view.rect("overlay.box", 60, 140, CANVAS_W - 60, 400, fill="#2c3e50", width=2, outline="#34495e")
+    view.text(
+        "overlay.lines",
+        CANVAS_W // 2,
+        270,
+        text="\n".join(lines),
+        fill="#ecf0f1",
+        font=("TkDefaultFont", 12),
+        justify="center",
+    )
+
+    # Professional call-to-action button
+    view.rect("overlay.button", CANVAS_W // 2 - 150, 420, CANVAS_W // 2 + 150, 460, fill="#e74c3c", width=0)
+    view.text(
+        "overlay.button_text",
+        CANVAS_W // 2,
+        440,
+        text=button,
+        fill="#ffffff",
+        font=("TkDefaultFont", 12, "bold"),
+    )
+
+
 # ------------------------------
 # Scene System
 # ------------------------------
 class Scene:
     name: str = "Scene"
+    # Set by SceneManager.switch before on_enter; the canvas is empty by then.
+    view: View
+    # The app's clock; scenes read time through clock.now() so they can run headless.
+    clock: "Clock"
+    # SceneManager only calls draw while this is set; see invalidate().
+    dirty: bool = True
+    # Pathfinding/search time spent inside this tick's update; the scene adds
+    # to it and SceneManager records and resets it.
+    replan_s: float = 0.0
+
+    def invalidate(self) -> None:
+        """Ask for a redraw on the next tick (input, timer text, toast expiry...).
+
+        Frames nobody invalidated skip ``draw`` entirely, so ``update`` should
+        call this only when something on screen changes: every frame while a
+        running timer is shown, otherwise just when ``Toasts.update`` drops a
+        toast. SceneManager invalidates after every key press.
+        """
+        self.dirty = True
+
+    def idle_for(self, app: "GameApp") -> Optional[float]:
+        """Seconds this scene can go without ticks (math.inf: until a key press).
+
+        None, the default, keeps the clock running every frame.
+        """
+        return None
 
     def on_enter(self, app: "GameApp") -> None:
         pass
@@ -162,55 +328,247 @@ class SceneManager:
     def __init__(self, app: "GameApp"):
         self.app = app
         self.current: Optional[Scene] = None
+        self.view = View(app.canvas)
+        self.stats = FrameStats()
+        self.last_sample: Optional[FrameSample] = None
+        self.show_stats = False  # F3 toggles the debug overlay
+        self._stats_frame = 0
 
     def switch(self, scene: Scene) -> None:
         if self.current:
             self.current.on_exit(self.app)
+        self.view.clear()
         self.current = scene
+        self.current.view = self.view
+        self.current.clock = self.app.clock
+        self.current.dirty = True
         self.current.on_enter(self.app)
+        # The old scene may have put the clock to sleep (idle_for); the new one starts now
+        self.app.clock.wake()
 
     def update(self, dt: float) -> None:
         if self.current:
             self.current.update(self.app, dt)
 
     def draw(self, c: tk.Canvas) -> None:
-        if self.current:
+        # Static frames (nothing invalidated since the last draw) cost nothing
+        if self.current and self.current.dirty:
+            self.current.dirty = False
             self.current.draw(self.app, c)
 
+    def tick(self, dt: float, draw: bool = True) -> None:
+        """One frame: update, draw if dirty (and not skipped), and record what it cost."""
+        if not self.current:
+            return
+        scene = self.current
+        scene.replan_s = 0.0
+        t0 = time.perf_counter()
+        self.update(dt)
+        t1 = time.perf_counter()
+        if draw:
+            self.draw(self.app.canvas)
+        t2 = time.perf_counter()
+        self.last_sample = FrameSample(scene.name, t1 - t0, t2 - t1, len(self.view.items),
+                                       self.app.clock.lateness, scene.replan_s)
+        self.stats.record(self.last_sample)
+        if self.show_stats and draw:
+            self._draw_stats()
+        elif draw and not self.current.dirty:
+            # Nothing left to show: let the clock sleep until the scene's next change
+            idle = self.current.idle_for(self.app)
+            if idle is not None:
+                self.app.clock.sleep(idle)
+
+    def _draw_stats(self) -> None:
+        # Percentiles need a sort, so refresh the overlay a few times a second only
+        self._stats_frame += 1
+        if "debug" in self.view and self._stats_frame % 15:
+            return
+        if "debug" not in self.view:
+            self.view.text("debug", 10, CANVAS_H - 10, text="", fill=WARN,
+                           font=("TkFixedFont", 9), anchor="sw", justify="left")
+        self.view.config("debug", text=self.stats.report(self.current.name), state="normal")
+
     def handle_key(self, e: tk.Event) -> None:
+        self.app.clock.wake()
+        if e.keysym == "F3":
+            self.show_stats = not self.show_stats
+            if "debug" in self.view:
+                self.view.show("debug", self.show_stats)
+            return
         if self.current:
             self.current.handle_key(self.app, e)
+            # May be a different scene by now; that one starts dirty anyway
+            self.current.invalidate()
 
 
 # ------------------------------
 # Timing & Clock
 # ------------------------------
 class Clock:
-    def __init__(self, root: tk.Tk):
+    """Fixed-rate tick scheduler driven by Tk's ``after``.
+
+    Ticks are aimed at absolute deadlines (``start + n * period`` from
+    ``perf_counter``), so the time a tick takes no longer stretches the
+    period. When it falls behind, missed ticks still run their update but
+    skip the draw, up to ``MAX_CATCHUP``; beyond that (window dragged,
+    machine asleep) the schedule resyncs instead of fast-forwarding.
+
+    A tick may call ``sleep`` to stop the loop while nothing is animating;
+    ``wake`` (key press, toast) or the sleep timeout restarts it.
+    """
+
+    MAX_CATCHUP = 4  # at 60 FPS: at most 1/15 s of simulation replayed per wake
+
+    def __init__(self, root: tk.Tk, fps: float = FPS_TARGET):
         self.root = root
         self.running = False
-        self._last = 0.0
+        self.sleeping = False
+        self.fps = fps
+        self._tick: Optional[Callable[[float, bool], None]] = None
+        self._next = 0.0
+        self._sleep_request: Optional[float] = None
+        self._after_id = None
+        self.lateness = 0.0  # how far behind schedule the current tick started (s)
+        self.skipped_draws = 0
+
+    @property
+    def period(self) -> float:
+        return 1.0 / self.fps
+
+    def now(self) -> float:
+        return time.perf_counter()
 
-    def start(self, tick: Callable[[float], None]) -> None:
+    def start(self, tick: Callable[[float, bool], None]) -> None:
+        """Call ``tick(dt, draw)`` every period until ``stop``."""
         self.running = True
+        self._tick = tick
+        self._next = self.now()
+        self._loop()
 
-        def loop():
-            if not self.running:
-                return
-            now = time.perf_counter()
-            dt = now - self._last if self._last else 1.0 / FPS_TARGET
-            self._last = now
-            # clamp dt to avoid jumps if the window is paused
-            dt = min(dt, 1 / 15)
-            tick(dt)
-            self.root.after(int(1000 / FPS_TARGET), loop)
+    def _loop(self) -> None:
+        self._after_id = None
+        if not self.running:
+            return
+        period = self.period
+        now = self.now()
+        self.lateness = max(0.0, now - self._next)
+        behind = int(self.lateness / period)
+        if behind > self.MAX_CATCHUP:
+            # Too far behind to catch up: drop the backlog
+            self._next = now
+            behind = 0
+        for _ in range(behind):
+            self._tick(period, False)
+            self.skipped_draws += 1
+        self._tick(period, True)
+        self._next += (behind + 1) * period
+
+        if self._sleep_request is not None:
+            seconds, self._sleep_request = self._sleep_request, None
+            self.sleeping = True
+            if seconds != math.inf:
+                self._after_id = self.root.after(max(1, int(seconds * 1000)), self.wake)
+            return
+        delay_ms = max(0, int((self._next - self.now()) * 1000))
+        self._after_id = self.root.after(delay_ms, self._loop)
 
-        loop()
+    def sleep(self, seconds: float = math.inf) -> None:
+        """Stop ticking after the current tick, for ``seconds`` or until ``wake``."""
+        self._sleep_request = seconds
+
+    def wake(self) -> None:
+        """Resume ticking straight away; no-op unless asleep."""
+        self._sleep_request = None
+        if not self.sleeping or not self.running:
+            return
+        self.sleeping = False
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+        self._next = self.now()  # a deliberate pause is not lateness
+        self._after_id = self.root.after(0, self._loop)
 
     def stop(self) -> None:
         self.running = False
 
 
+# ------------------------------
+# Frame instrumentation
+# ------------------------------
+@dataclass
+class FrameSample:
+    """Cost of one tick."""
+    scene: str
+    update_s: float
+    draw_s: float
+    items: int
+    late_s: float = 0.0
+    replan_s: float = 0.0  # part of update_s
+
+
+class FrameStats:
+    """Per-scene ring buffers of the last ``size`` ticks.
+
+    ``summary(scene)`` gives p50/p95/p99/max for update, draw, item count and
+    scheduling lateness; ``report(scene)`` formats it for the F3 overlay.
+    """
+
+    FIELDS = ("update_s", "draw_s", "items", "late_s", "replan_s")
+
+    def __init__(self, size: int = 600):
+        self.size = size
+        self._buffers: dict[str, dict[str, array]] = {}
+        self._count: dict[str, int] = {}  # ticks recorded per scene (not capped)
+
+    def record(self, sample: FrameSample) -> None:
+        bufs = self._buffers.get(sample.scene)
+        if bufs is None:
+            bufs = self._buffers[sample.scene] = {f: array("d", bytes(8 * self.size)) for f in self.FIELDS}
+            self._count[sample.scene] = 0
+        i = self._count[sample.scene] % self.size
+        for f in self.FIELDS:
+            bufs[f][i] = getattr(sample, f)
+        self._count[sample.scene] += 1
+
+    def scenes(self) -> list[str]:
+        return list(self._buffers)
+
+    def samples(self, scene: str, field: str) -> list[float]:
+        """The retained values of one field, oldest first."""
+        if scene not in self._buffers:
+            return []
+        buf = self._buffers[scene][field]
+        count = self._count[scene]
+        if count <= self.size:
+            return buf[:count].tolist()
+        i = count % self.size
+        return (buf[i:] + buf[:i]).tolist()
+
+    def summary(self, scene: str) -> dict[str, dict[str, float]]:
+        out = {}
+        for f in self.FIELDS:
+            values = sorted(self.samples(scene, f))
+            if not values:
+                continue
+            pick = lambda q: values[min(len(values) - 1, int(q * len(values)))]
+            out[f] = {"p50": pick(0.50), "p95": pick(0.95), "p99": pick(0.99), "max": values[-1]}
+        return out
+
+    def report(self, scene: str) -> str:
+        stats = self.summary(scene)
+        n = min(self._count.get(scene, 0), self.size)
+        lines = [f"{scene}  (last {n} ticks)"]
+        for f, label, scale in (("update_s", "update ms", 1000), ("draw_s", "draw ms", 1000),
+                                ("late_s", "late ms", 1000), ("replan_s", "replan ms", 1000),
+                                ("items", "items", 1)):
+            p = stats.get(f)
+            if p is None or (f == "replan_s" and not p["max"]):
+                continue  # replan only shows for scenes that do pathfinding
+            lines.append(f"{label:9s} p50 {p['p50'] * scale:7.2f}  p95 {p['p95'] * scale:7.2f}  "
+                         f"p99 {p['p99'] * scale:7.2f}")
+        return "\n".join(lines)
+
+
 # ------------------------------
 # Results Dataclass
 # ------------------------------
@@ -230,28 +588,153 @@ class MinigameResult:
 # Simple Toast (text that fades)
 # ------------------------------
 class Toasts:
-    def __init__(self):
+    def __init__(self, on_add: Optional[Callable[[], None]] = None):
         self.messages: list[tuple[str, float]] = []  # (text, ttl)
+        self.on_add = on_add  # e.g. wake an idle clock so the toast gets drawn and ages
 
     def add(self, text: str, ttl: float = 1.5) -> None:
         self.messages.append((text, ttl))
+        if self.on_add:
+            self.on_add()
 
-    def update(self, dt: float) -> None:
+    def update(self, dt: float) -> bool:
+        """Age the messages; return True if one expired and the screen needs redrawing."""
         if not self.messages:
-            return
+            return False
+        count = len(self.messages)
         self.messages = [(t, ttl - dt) for (t, ttl) in self.messages if ttl - dt > 0]
+        return len(self.messages) != count
 
-    def draw(self, c: tk.Canvas) -> None:
-        if not self.messages:
-            return
+    def draw(self, view: View) -> None:
+        # Three reusable slots, created on first use so they sit above the scene
+        shown = self.messages[-3:]
         y = CANVAS_H - 40
-        for text, ttl in self.messages[-3:]:
-            alpha = clamp(ttl / 1.5, 0.0, 1.0)
-            c.create_text(
-                CANVAS_W // 2,
-                y,
-                text=text,
-                fill=FG,
-                font=("TkDefaultFont", 14, "bold"),
-            )
+        for i in range(3):
+            key = f"toast.{i}"
+            if i < len(shown):
+                if key not in view:
+                    view.text(key, CANVAS_W // 2, y, text="", fill=FG, font=("TkDefaultFont", 14, "bold"))
+                view.config(key, text=shown[i][0], state="normal")
+            elif key in view:
+                view.show(key, False)
             y -= 22
+
+
+# ------------------------------
+# Headless backend (no Tk display)
+# ------------------------------
+class RecordingCanvas:
+    """In-memory stand-in for ``tk.Canvas`` that keeps items and counts calls.
+
+    Supports everything scenes use (``create_*``, ``delete``, ``itemconfig``,
+    ``coords``, tags), so the whole game can be benchmarked without a display.
+    """
+
+    def __init__(self, width: int = CANVAS_W, height: int = CANVAS_H):
+        self.width = width
+        self.height = height
+        self.items: dict[int, dict] = {}  # id -> {"kind", "coords", "opts", "tags"}
+        self.calls: dict[str, int] = {}
+        self._next_id = 1
+
+    def _count(self, op: str) -> None:
+        self.calls[op] = self.calls.get(op, 0) + 1
+
+    def _create(self, kind: str, coords: tuple, opts: dict) -> int:
+        self._count("create")
+        item = self._next_id
+        self._next_id += 1
+        tags = opts.get("tags", ())
+        self.items[item] = {
+            "kind": kind,
+            "coords": coords,
+            "opts": opts,
+            "tags": (tags,) if isinstance(tags, str) else tuple(tags),
+        }
+        return item
+
+    def create_rectangle(self, *coords: float, **opts) -> int:
+        return self._create("rectangle", coords, opts)
+
+    def create_text(self, *coords: float, **opts) -> int:
+        return self._create("text", coords, opts)
+
+    def create_line(self, *coords: float, **opts) -> int:
+        return self._create("line", coords, opts)
+
+    def create_oval(self, *coords: float, **opts) -> int:
+        return self._create("oval", coords, opts)
+
+    def create_polygon(self, *coords: float, **opts) -> int:
+        return self._create("polygon", coords, opts)
+
+    def _find(self, tag_or_id) -> list[int]:
+        if tag_or_id == "all":
+            return list(self.items)
+        if isinstance(tag_or_id, int):
+            return [tag_or_id] if tag_or_id in self.items else []
+        return [i for i, item in self.items.items() if tag_or_id in item["tags"]]
+
+    def delete(self, *items) -> None:
+        self._count("delete")
+        for tag_or_id in items:
+            for i in self._find(tag_or_id):
+                del self.items[i]
+
+    def itemconfig(self, item, **opts) -> None:
+        self._count("itemconfig")
+        for i in self._find(item):
+            self.items[i]["opts"].update(opts)
+
+    itemconfigure = itemconfig
+
+    def coords(self, item, *coords: float):
+        if not coords:
+            found = self._find(item)
+            return list(self.items[found[0]]["coords"]) if found else []
+        self._count("coords")
+        for i in self._find(item):
+            self.items[i]["coords"] = coords
+
+    def focus_set(self) -> None:
+        pass
+
+
+class HeadlessClock(Clock):
+    """Synthetic clock: time only moves when the driver calls ``advance``."""
+
+    def __init__(self) -> None:
+        super().__init__(None)
+        self.t = 0.0
+        self.wake_at = math.inf
+
+    def now(self) -> float:
+        return self.t
+
+    def advance(self, dt: float) -> None:
+        self.t += dt
+        if self.sleeping and self.t >= self.wake_at:
+            self.wake()
+
+    def start(self, tick: Callable[[float, bool], None]) -> None:
+        self.running = True
+
+    def sleep(self, seconds: float = math.inf) -> None:
+        self.sleeping = True
+        self.wake_at = self.t + seconds
+
+    def wake(self) -> None:
+        self.sleeping = False
+        self.wake_at = math.inf
+
+
+@dataclass
+class KeyEvent:
+    """Minimal stand-in for ``tk.Event`` when injecting key presses."""
+    keysym: str
+    char: str = ""
+
+    @classmethod
+    def press(cls, keysym: str) -> "KeyEvent":
+        char = keysym if len(keysym) == 1 else {"space": " "}.get(keysym, "")
+        return cls(keysym, char)
@@ -8,31 +8,66 @@ Minimal playable build (v0.1):
 - Main menu, interlude, results
 
 Controls
-- Global: Enter/Space to select/continue, Esc to quit
+- Global: Enter/Space to select/continue, Esc to quit, F3 toggles frame-time stats
 - Email Blast: Type letters; Backspace deletes; Enter submits when text matches
 
 No external assets, no networking. Works on Windows/macOS/Linux with tkinter.
+
+Headless soak/benchmark (no display or tkinter needed):
+    python main.py --headless [FRAMES]
 """
 from __future__ import annotations
 
 import random
+import sys
 import time
-from typing import Optional
-
-try:
-    import tkinter as tk
-except Exception as e:  # pragma: no cover
-    raise SystemExit("tkinter is required to run this game.\n" + str(e))
+from pathlib import Path
+from typing import Iterable, Optional
 
 from game_common import (
-    CANVAS_W, CANVAS_H, FPS_TARGET,
-    Clock, SceneManager, HighScoreManager, Toasts, MinigameResult
+    CANVAS_W, CANVAS_H, FPS_TARGET, SCORES_PATH, CACHE_DIRNAME, MATH_COUNT, tk,
+    ESCAPE_GRID_W, ESCAPE_GRID_H, ESCAPE_LOOPS, ESCAPE_FOG,
+    Clock, SceneManager, HighScoreManager, Toasts, MinigameResult, Scene,
+    RecordingCanvas, HeadlessClock, KeyEvent, FrameSample
 )
+from escape_maze import MazeBank
+from excel_problems import BANK_NAME as PROBLEM_BANK_NAME, ProblemBank
+from puzzle_bank import BANK_NAME, PuzzleBank
+from puzzle_game import PIECES, PuzzleGame
 from scenes import MainMenu
 
 
 class GameApp:
-    def __init__(self) -> None:
+    def __init__(self, headless: bool = False, scores_path: Path = SCORES_PATH) -> None:
+        self.headless = headless
+        self.scores = HighScoreManager(scores_path)
+        self.toasts = Toasts(on_add=lambda: self.clock.wake())
+        self.rng = random.Random(time.time_ns() & 0xFFFFFFFF)
+        self.run_results: list[MinigameResult] = []
+        # Friday Escape mazes, seeded from the run RNG; the interactive build
+        # pre-generates them on a worker thread, headless builds on demand
+        self.mazes = MazeBank(ESCAPE_GRID_W, ESCAPE_GRID_H, self.rng.getrandbits(32),
+                              ESCAPE_LOOPS, scores_path.parent / CACHE_DIRNAME, sight=ESCAPE_FOG)
+        # Calendar puzzle hands, memory-mapped from the bank ``python puzzle_bank.py``
+        # builds; without one each hand is dealt and solved on entry
+        self.puzzles = PuzzleBank.open(scores_path.parent / CACHE_DIRNAME / BANK_NAME,
+                                       [p["cells"] for p in PIECES],
+                                       PuzzleGame.GRID_W, PuzzleGame.GRID_H, PuzzleGame.HAND)
+        # Excel Fire Drill question sets from a tournament bank (``python excel_problems.py``),
+        # if one is installed; otherwise each run generates its own from a seed
+        self.problems = ProblemBank.open(scores_path.parent / CACHE_DIRNAME / PROBLEM_BANK_NAME, MATH_COUNT)
+
+        if headless:
+            self.root = None
+            self.canvas = RecordingCanvas()
+            self.clock = HeadlessClock()
+            self.scenes = SceneManager(self)
+            self.quit_requested = False
+            self.scenes.switch(MainMenu())
+            return
+
+        if tk is None:
+            raise SystemExit("tkinter is required to run this game (use --headless without a display).")
         self.root = tk.Tk()
         self.root.title("Consulting Chaos")
         self.root.resizable(False, False)
@@ -45,10 +80,7 @@ class GameApp:
         
         self.clock = Clock(self.root)
         self.scenes = SceneManager(self)
-        self.scores = HighScoreManager()
-        self.toasts = Toasts()
-        self.rng = random.Random(time.time_ns() & 0xFFFFFFFF)
-        self.run_results: list[MinigameResult] = []
+        self.mazes.start()
         
         # Input
         self.root.bind("<Key>", self.scenes.handle_key)
@@ -66,22 +98,96 @@ class GameApp:
         self.root.after_idle(lambda: self.scenes.draw(self.canvas))
 
     def run(self) -> None:
-        def tick(dt: float) -> None:
-            self.scenes.update(dt)
-            self.scenes.draw(self.canvas)
-        self.clock.start(tick)
+        self.clock.start(self.scenes.tick)
         self.root.mainloop()
 
+    def run_headless(
+        self,
+        frames: int,
+        dt: float = 1.0 / FPS_TARGET,
+        scene: Optional[Scene] = None,
+        keys: Iterable[tuple[int, str]] = (),
+    ) -> list[FrameSample]:
+        """Drive update/draw on the recording canvas with a synthetic clock.
+
+        ``keys`` are ``(frame, keysym)`` presses delivered before that frame's
+        update. Returns one sample per tick actually run (idle scenes let the
+        clock sleep, so they produce fewer); stops early if a scene quits.
+        """
+        if scene is not None:
+            self.scenes.switch(scene)
+        pending: dict[int, list[str]] = {}
+        for frame, keysym in keys:
+            pending.setdefault(frame, []).append(keysym)
+        samples = []
+        for frame in range(frames):
+            if self.quit_requested:
+                break
+            for keysym in pending.get(frame, ()):
+                self.scenes.handle_key(KeyEvent.press(keysym))
+            self.clock.advance(dt)
+            if self.clock.sleeping:
+                continue  # idle scene: no tick, nothing to record
+            self.scenes.tick(dt)
+            samples.append(self.scenes.last_sample)
+        return samples
+
     def reset_run(self) -> None:
         self.run_results = []
 
     def quit(self) -> None:
         self.clock.stop()
+        self.mazes.stop()
+        if self.headless:
+            self.quit_requested = True
+            return
         self.root.destroy()
 
 
+def soak(frames: int = 600) -> None:
+    """Run every scene headlessly and print per-frame cost (no display needed)."""
+    import tempfile
+    from email_blast import EmailBlast
+    from excel_fire_drill import ExcelFireDrill
+    from friday_escape import FridayEscape
+    from scenes import Interlude, Results
+
+    with tempfile.TemporaryDirectory() as tmp:
+        app = GameApp(headless=True, scores_path=Path(tmp) / "scores.json")
+        demo = [MinigameResult("Email Blast", 20.0, 0.6, {})]
+        # Minigames get an Enter press so they leave their start overlay
+        start = [(1, "Return")]
+        scenes = [
+            (MainMenu(), ()),
+            (Interlude(next_scene=MainMenu(), last_result=demo[0]), ()),
+            (EmailBlast(), start),
+            (ExcelFireDrill(), start),
+            (PuzzleGame(), start),
+            (FridayEscape(), start),
+            (Results(demo), ()),
+        ]
+        print(f"{'scene':28s} {'frames':>6s} {'update ms':>10s} {'draw ms':>8s} {'max draw':>9s} {'items':>6s}")
+        for scene, keys in scenes:
+            samples = app.run_headless(frames, scene=scene, keys=keys)
+            n = len(samples)
+            if not n:  # an idle scene can sleep through the whole run
+                print(f"{scene.name:28s} {n:6d} {'-':>10s} {'-':>8s} {'-':>9s} {'-':>6s}")
+                continue
+            print(
+                f"{scene.name:28s} {n:6d} "
+                f"{sum(s.update_s for s in samples) / n * 1000:10.3f} "
+                f"{sum(s.draw_s for s in samples) / n * 1000:8.3f} "
+                f"{max(s.draw_s for s in samples) * 1000:9.3f} "
+                f"{max(s.items for s in samples):6d}"
+            )
+
+
 # ------------------------------
 # Main
 # ------------------------------
 if __name__ == "__main__":
-    GameApp().run()
+    if "--headless" in sys.argv:
+        args = sys.argv[sys.argv.index("--headless") + 1:]
+        soak(int(args[0]) if args else 600)
+    else:
+        GameApp().run()
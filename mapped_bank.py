@@ -0,0 +1,65 @@
+"""
+Read-only, memory-mapped banks of fixed-size records.
+
+The pre-generated puzzle hands and Excel Fire Drill question sets share one
+file layout: a ``struct`` header starting with a magic string, then
+``count`` records of ``record`` bytes each. ``MappedBank`` maps the file
+once, so picking a record by seed is a single slice.
+"""
+from __future__ import annotations
+
+import mmap
+import struct
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Optional
+
+
+class MappedBank(ABC):
+    """A bank file mapped into memory; ``read`` is O(1).
+
+    Subclasses set ``MAGIC`` and ``HEADER`` (whose first field is the magic)
+    and implement ``_layout``, which turns the remaining header fields into
+    the record size and count, raising ValueError if the file was built for
+    something else.
+    """
+
+    MAGIC: bytes
+    HEADER: struct.Struct
+
+    def __init__(self, path: Path):
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, *fields = self.HEADER.unpack_from(self._map)
+            if magic != self.MAGIC:
+                raise ValueError(f"{path} is not a {type(self).__name__} file")
+            self.record, self.count = self._layout(path, fields)
+            if self.count == 0 or len(self._map) < self.HEADER.size + self.count * self.record:
+                raise ValueError(f"{path} is empty or truncated")
+        except (ValueError, struct.error):
+            self._map.close()
+            raise
+
+    @abstractmethod
+    def _layout(self, path: Path, fields: list) -> tuple[int, int]:
+        """(record size, record count) for the header ``fields`` after the magic."""
+
+    @classmethod
+    def open(cls, path: Path, *args) -> Optional["MappedBank"]:
+        """The bank at ``path``, or None if it is missing, empty or built for something else."""
+        try:
+            return cls(path, *args)
+        except (OSError, ValueError, struct.error):
+            return None
+
+    def __len__(self) -> int:
+        return self.count
+
+    def read(self, seed: int) -> bytes:
+        """Bytes of record ``seed % len(self)``."""
+        at = self.HEADER.size + (seed % self.count) * self.record
+        return self._map[at:at + self.record]
+
+    def close(self) -> None:
+        self._map.close()
@@ -0,0 +1,145 @@
+"""
+Pre-generated hands for the Calendar Scheduler puzzle.
+
+``build`` deals piece sequences on a process pool, keeps only those the
+exact-cover solver can pack, and writes them as fixed-size records: the
+piece index of every slot in the hand, then the slot covering each board
+cell (``EMPTY`` for none) as one known solution. ``PuzzleBank`` memory-maps
+the file, so picking a hand by seed is one slice and nothing is solved on
+the hot path. Hand ``i`` depends only on the build seed and ``i``.
+
+Build the default bank (next to the scores file) with:
+    python puzzle_bank.py [COUNT]
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import random
+import struct
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional, Sequence
+
+from mapped_bank import MappedBank
+from puzzle_board import Board, Solver, bits, orientation_table
+
+MAGIC = b"CCPB1"
+# magic, board width, board height, hand size, record count, piece shapes hash
+HEADER = struct.Struct("<5sBBBI20s")
+EMPTY = 0xFF
+BANK_NAME = "puzzles.bin"
+DEFAULT_COUNT = 20000
+CHUNK = 250  # hands per pool task
+
+Shapes = Sequence[Sequence[tuple[int, int]]]
+
+
+def shapes_key(shapes: Shapes) -> bytes:
+    """Hash of the piece definitions, so a bank never outlives the pieces it was built for."""
+    return hashlib.sha1(repr([list(map(tuple, cells)) for cells in shapes]).encode()).digest()
+
+
+def make_solver(board: Board, shapes: Shapes) -> Solver:
+    return Solver(board, orientation_table(shapes, board.w, board.h))
+
+
+def deal(rng: random.Random, solver: Solver, hand: int, tries: int = 100) -> tuple[list[int], list[int]]:
+    """Draw ``hand`` pieces (with replacement) until they can all be packed.
+
+    Returns the piece indices and, per slot, the mask it covers in one
+    packing. Raises ValueError if ``tries`` draws all fail.
+    """
+    kinds = len(solver.sizes)
+    for _ in range(tries):
+        pieces = [rng.randrange(kinds) for _ in range(hand)]
+        counts = [0] * kinds
+        for t in pieces:
+            counts[t] += 1
+        plan = solver.solve(0, tuple(counts))
+        if plan is not None:
+            return pieces, assign(pieces, plan)
+    raise ValueError(f"no packable hand of {hand} pieces in {tries} draws")
+
+
+def assign(pieces: Sequence[int], plan: Sequence[tuple[int, int]], start: int = 0) -> list[int]:
+    """Spread a solver packing over hand slots ``start`` onwards (0 for the slots before)."""
+    by_type: dict[int, list[int]] = {}
+    for t, m in plan:
+        by_type.setdefault(t, []).append(m)
+    return [by_type[t].pop() if k >= start else 0 for k, t in enumerate(pieces)]
+
+
+def _make_records(job: tuple[list, int, int, int, int, int, int]) -> bytes:
+    # runs in a pool worker: deal hands first..stop-1 and pack them into records
+    shapes, width, height, hand, seed, first, stop = job
+    board = Board(width, height)
+    solver = make_solver(board, shapes)
+    out = bytearray()
+    for i in range(first, stop):
+        pieces, masks = deal(random.Random(f"{seed}:{i}"), solver, hand)
+        solver.clear()
+        slots = bytearray([EMPTY]) * (width * height)
+        for k, m in enumerate(masks):
+            for cell in bits(m):
+                slots[cell] = k
+        out += bytes(pieces) + slots
+    return bytes(out)
+
+
+def build(path: Path, shapes: Shapes, count: int = DEFAULT_COUNT, seed: int = 0,
+          width: int = 8, height: int = 8, hand: int = 15, workers: Optional[int] = None) -> None:
+    """Write a bank of ``count`` packable hands to ``path`` (replaced atomically)."""
+    if len(shapes) > EMPTY or hand >= EMPTY:
+        raise ValueError("piece and slot indices must fit in a byte")
+    shapes = [list(map(tuple, cells)) for cells in shapes]
+    jobs = [(shapes, width, height, hand, seed, first, min(count, first + CHUNK))
+            for first in range(0, count, CHUNK)]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "wb") as f:
+        f.write(HEADER.pack(MAGIC, width, height, hand, count, shapes_key(shapes)))
+        with ProcessPoolExecutor(workers) as pool:
+            for chunk in pool.map(_make_records, jobs):
+                f.write(chunk)
+    os.replace(tmp, path)
+
+
+class PuzzleBank(MappedBank):
+    """Read-only view of a bank file; ``pick`` is O(1) and allocation-light."""
+
+    MAGIC = MAGIC
+    HEADER = HEADER
+
+    def __init__(self, path: Path, shapes: Shapes, width: int, height: int, hand: int):
+        self.hand = hand
+        self._expect = (width, height, hand, shapes_key(shapes))
+        super().__init__(path)
+
+    def _layout(self, path: Path, fields: list) -> tuple[int, int]:
+        w, h, n, count, key = fields
+        if (w, h, n, key) != self._expect:
+            raise ValueError(f"{path} is not a bank for these pieces")
+        return n + w * h, count
+
+    def pick(self, seed: int) -> tuple[list[int], list[int]]:
+        """Piece indices of hand ``seed % len(self)`` and the mask each slot covers in its solution."""
+        record = self.read(seed)
+        pieces = list(record[:self.hand])
+        masks = [0] * self.hand
+        for cell, k in enumerate(record[self.hand:]):
+            if k != EMPTY:
+                masks[k] |= 1 << cell
+        return pieces, masks
+
+
+if __name__ == "__main__":
+    from game_common import SCORES_PATH, CACHE_DIRNAME
+    from puzzle_game import PIECES, PuzzleGame
+
+    target = SCORES_PATH.parent / CACHE_DIRNAME / BANK_NAME
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_COUNT
+    build(target, [p["cells"] for p in PIECES], total,
+          width=PuzzleGame.GRID_W, height=PuzzleGame.GRID_H, hand=PuzzleGame.HAND)
+    print(f"wrote {total} hands to {target}")
@@ -0,0 +1,304 @@
+"""
+Board state for the Calendar Scheduler puzzle.
+
+Occupancy is a single int with bit ``y * width + x`` set per filled cell, so
+placement tests and fill checks are one or two integer operations at any
+board size (Python ints grow as needed). Each piece is compiled once into
+its distinct orientations, normalised to a (0, 0) bounding-box corner, with
+the mask for every anchor, so rotating is an index step and placing is a
+tuple lookup.
+"""
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, Optional, Sequence
+
+Cells = tuple[tuple[int, int], ...]
+
+
+@dataclass(frozen=True)
+class Orientation:
+    """One distinct rotation of a piece, shifted so its bounding box starts at (0, 0)."""
+    cells: Cells
+    w: int
+    h: int
+    masks: tuple[int, ...] = field(repr=False)  # per anchor cell ``y * board_width + x``; 0 off the board
+
+    def mask(self, board_w: int, x: int, y: int) -> int:
+        """Cells covered with the top-left corner at (x, y); 0 if off the board."""
+        if 0 <= x < board_w and 0 <= y and y * board_w + x < len(self.masks):
+            return self.masks[y * board_w + x]
+        return 0
+
+
+def orientations(cells: Iterable[tuple[int, int]], width: int, height: int) -> tuple[Orientation, ...]:
+    """Distinct quarter turns of ``cells`` in clockwise order (so the next
+    index is always one turn clockwise), with masks for a ``width`` x
+    ``height`` board."""
+    out: list[Orientation] = []
+    for turned in rotations(cells):
+        min_x = min(x for x, _ in turned)
+        min_y = min(y for _, y in turned)
+        norm = tuple(sorted((x - min_x, y - min_y) for x, y in turned))
+        if any(o.cells == norm for o in out):
+            break  # back to a turn already seen: the cycle repeats from here
+        w = max(x for x, _ in norm) + 1
+        h = max(y for _, y in norm) + 1
+        base = sum(1 << (y * width + x) for x, y in norm)
+        masks = tuple(base << (y * width + x) if x + w <= width and y + h <= height else 0
+                      for y in range(height) for x in range(width))
+        out.append(Orientation(norm, w, h, masks))
+    return tuple(out)
+
+
+def orientation_table(shapes: Iterable[Iterable[tuple[int, int]]], width: int, height: int
+                      ) -> tuple[tuple[Orientation, ...], ...]:
+    """``orientations`` of every piece, for one board size."""
+    return tuple(orientations(cells, width, height) for cells in shapes)
+
+
+class Board:
+    """Bitboard occupancy plus a separate owner layer (piece index per cell) for drawing."""
+
+    def __init__(self, width: int, height: int):
+        self.w = width
+        self.h = height
+        self.full = (1 << (width * height)) - 1
+        self.occupied = 0
+        self.owner = array("b", [-1]) * (width * height)
+
+    def place(self, mask: int, piece: int) -> list[int]:
+        """Fill ``mask`` with ``piece``; returns the cell indices filled."""
+        self.occupied |= mask
+        filled = list(bits(mask))
+        for i in filled:
+            self.owner[i] = piece
+        return filled
+
+    def is_full(self) -> bool:
+        return self.occupied == self.full
+
+
+class PlacementIndex:
+    """Legal anchors of every orientation of every piece, kept in step with a board.
+
+    ``legal[t][r]`` has bit ``y * width + x`` set while orientation ``r`` of
+    piece ``t`` fits with its top-left corner at (x, y). ``fill`` drops every
+    anchor the new cells block with one shift per piece cell, so the index
+    never has to be rebuilt during a game.
+    """
+
+    def __init__(self, table: Sequence[Sequence[Orientation]], width: int, occupied: int = 0):
+        self.table = table
+        self.w = width
+        # per piece, per orientation: cell offsets from the anchor
+        self._offsets = [[tuple(y * width + x for x, y in o.cells) for o in orients] for orients in table]
+        self.legal = [[sum(1 << a for a, m in enumerate(o.masks) if m and not occupied & m) for o in orients]
+                      for orients in table]
+
+    def fill(self, mask: int) -> None:
+        """Cells ``mask`` were just occupied."""
+        for legal, offsets in zip(self.legal, self._offsets):
+            for r, cells in enumerate(offsets):
+                blocked = 0
+                for o in cells:
+                    blocked |= mask >> o
+                legal[r] &= ~blocked
+
+    def fits(self, piece: int, rot: int, x: int, y: int) -> bool:
+        return 0 <= x < self.w and y >= 0 and bool(self.legal[piece][rot] >> (y * self.w + x) & 1)
+
+    def any(self, piece: int) -> bool:
+        """Can ``piece`` still go anywhere, in any orientation?"""
+        return any(self.legal[piece])
+
+    def nearest(self, piece: int, rot: int, x: int, y: int) -> Optional[tuple[int, int, int]]:
+        """Closest legal (rot, x, y) to the given one: same orientation first, then any."""
+        w = self.w
+        for rots in ((rot,), range(len(self.legal[piece]))):
+            best = None
+            for r in rots:
+                for a in bits(self.legal[piece][r]):
+                    d = abs(a % w - x) + abs(a // w - y)
+                    if best is None or d < best[0]:
+                        best = (d, r, a % w, a // w)
+            if best is not None:
+                return best[1:]
+        return None
+
+
+def rotations(cells: Iterable[tuple[int, int]]) -> list[list[tuple[int, int]]]:
+    """``cells`` and its three quarter turns clockwise."""
+    out = [list(cells)]
+    for _ in range(3):
+        out.append([(y, -x) for x, y in out[-1]])
+    return out
+
+
+def bits(mask: int) -> Iterator[int]:
+    """Indices of the set bits of ``mask``, lowest first."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+_SOLVED = ()  # memo entry for "nothing left to place"
+
+
+class _OutOfBudget(Exception):
+    pass
+
+
+class Solver:
+    """Packs a multiset of pieces into a board's free cells (exact cover).
+
+    Pieces are the primary columns (each placed exactly once) and cells the
+    secondary ones: the free area the pieces leave over is covered by 1-cell
+    "holes", so the search can always branch on the lowest empty cell,
+    covering it with a placement whose lowest cell it is or with a hole.
+    Order of placement never matters for feasibility, so results are
+    memoised on (occupancy, piece counts) and reused across queries.
+
+    Before branching, cells no remaining piece can reach become holes
+    straight away, and each free region is charged the area the remaining
+    piece sizes cannot add up to; both are computed with whole-board shifts.
+
+    Most queries settle in well under a millisecond, but a bad position can
+    take tens of milliseconds, so ``solvable`` can stop after ``budget`` new
+    states and be called again to continue: every subtree already settled
+    stays in the memo, so no work is lost between slices.
+    """
+
+    def __init__(self, board: Board, table: Sequence[Sequence[Orientation]]):
+        # table[t]: the orientations of piece type t, from ``orientation_table``
+        self.board = board
+        n = board.w * board.h
+        self.sizes = [len(orients[0].cells) for orients in table]
+        self.by_low: list[list[list[int]]] = []  # [type][cell] -> masks whose lowest cell is cell
+        self.spans: list[list[tuple[int, tuple[int, ...]]]] = []  # [type] -> (anchor bits, cell offsets)
+        for orients in table:
+            lows: list[list[int]] = [[] for _ in range(n)]
+            spans: dict[tuple[int, ...], int] = {}
+            for o in orients:  # distinct orientations never share a mask
+                for m in o.masks:
+                    if not m:
+                        continue
+                    low = (m & -m).bit_length() - 1
+                    lows[low].append(m)
+                    offsets = tuple(i - low for i in bits(m))
+                    spans[offsets] = spans.get(offsets, 0) | 1 << low
+            self.by_low.append(lows)
+            self.spans.append([(anchors, offsets) for offsets, anchors in spans.items()])
+        w = board.w
+        left = sum(1 << (y * w) for y in range(board.h))
+        self._not_left = board.full & ~left  # cells a shift right by one may land on
+        self._not_right = board.full & ~(left << (w - 1))
+        self._memo: dict[tuple[int, tuple[int, ...]], object] = {}
+        self._budget: Optional[int] = None  # new states ``_search`` may still visit
+
+    def solve(self, occupied: int, counts: tuple[int, ...]) -> Optional[list[tuple[int, int]]]:
+        """One packing as (piece type, mask) placements, or None if there is none."""
+        if not self._search(occupied, counts):
+            return None
+        plan = []
+        while True:
+            move = self._memo[(occupied, counts)]
+            if move is _SOLVED:
+                return plan
+            t, m = move
+            occupied |= m
+            if t >= 0:
+                plan.append((t, m))
+                counts = counts[:t] + (counts[t] - 1,) + counts[t + 1:]
+
+    def solvable(self, occupied: int, counts: tuple[int, ...], budget: Optional[int] = None) -> Optional[bool]:
+        """Whether the pieces still pack; None if ``budget`` states weren't enough to tell yet."""
+        self._budget = budget
+        try:
+            return self._search(occupied, counts)
+        except _OutOfBudget:
+            return None
+        finally:
+            self._budget = None
+
+    def clear(self) -> None:
+        """Forget memoised states (they stay valid, but pile up over many hands)."""
+        self._memo.clear()
+
+    def _reach(self, free: int, counts: tuple[int, ...]) -> int:
+        """Free cells some placement of a remaining piece could cover."""
+        reach = 0
+        for t, c in enumerate(counts):
+            if c:
+                for anchors, offsets in self.spans[t]:
+                    fit = anchors
+                    for o in offsets:
+                        fit &= free >> o
+                    if fit:
+                        for o in offsets:
+                            reach |= fit << o
+        return reach
+
+    def _wasted(self, free: int, sums: int) -> int:
+        """Lower bound on free cells no piece can cover, given the achievable
+        piece-size totals ``sums`` (bit n set: some subset of pieces has n cells)."""
+        w, not_left, not_right = self.board.w, self._not_left, self._not_right
+        wasted = 0
+        while free:
+            region = free & -free
+            while True:
+                grown = region | free & ((region << 1 & not_left) | (region >> 1 & not_right)
+                                         | region << w | region >> w)
+                if grown == region:
+                    break
+                region = grown
+            free ^= region
+            area = region.bit_count()
+            wasted += area + 1 - (sums & ((2 << area) - 1)).bit_length()
+        return wasted
+
+    def _search(self, occ: int, counts: tuple[int, ...]) -> bool:
+        key = (occ, counts)
+        move = self._memo.get(key)
+        if move is not None:
+            return move is not False
+        if not any(counts):
+            self._memo[key] = _SOLVED
+            return True
+        if self._budget is not None:
+            if self._budget <= 0:
+                raise _OutOfBudget
+            self._budget -= 1
+        free = self.board.full & ~occ
+        holes = free.bit_count()
+        sums = 1
+        for c, s in zip(counts, self.sizes):
+            holes -= c * s
+            for _ in range(c):
+                sums |= sums << s
+        reach = self._reach(free, counts)
+        dead = free & ~reach
+        if holes < dead.bit_count() + self._wasted(reach, sums):
+            self._memo[key] = False
+            return False
+        if dead:
+            found = self._search(occ | dead, counts)
+            self._memo[key] = (-1, dead) if found else False
+            return found
+        low_bit = free & -free
+        low = low_bit.bit_length() - 1
+        for t, c in enumerate(counts):
+            if not c:
+                continue
+            rest = counts[:t] + (c - 1,) + counts[t + 1:]
+            for m in self.by_low[t][low]:
+                if not occ & m and self._search(occ | m, rest):
+                    self._memo[key] = (t, m)
+                    return True
+        if holes and self._search(occ | low_bit, counts):
+            self._memo[key] = (-1, low_bit)
+            return True
+        self._memo[key] = False
+        return False
@@ -4,18 +4,44 @@ Puzzle minigame - Tetris-like puzzle solving for Consulting Chaos.
 from __future__ import annotations
 
 import math
-import time
 from typing import TYPE_CHECKING
 
 from game_common import (
-    Scene, MinigameResult, CANVAS_W, CANVAS_H, BG, FG, ACCENT, GOOD, BAD, WARN, MUTED, CARD, GRID,
+    Scene, MinigameResult, build_start_overlay, CANVAS_W, CANVAS_H, BG, FG, ACCENT, GOOD, BAD, WARN, MUTED, CARD, GRID,
     CAL_TARGET_SECONDS, CAL_OVER_PENALTY_PER_10S, CAL_LEFTOVER_PENALTY, clamp
 )
+from puzzle_bank import assign, deal
+from puzzle_board import Board, Orientation, PlacementIndex, Solver, orientation_table
 
 if TYPE_CHECKING:
     from main import GameApp
 
 
+# Meeting blocks (calendar-style pieces)
+PIECES = [
+    {"cells": [(0, 0), (1, 0), (0, 1), (1, 1)], "name": "Team Standup", "color": "#4A90E2"},  # 2x2 square
+    {"cells": [(0, 0), (1, 0), (2, 0), (3, 0)], "name": "All Hands", "color": "#7ED321"},      # 4x1 line
+    {"cells": [(0, 0), (1, 0), (2, 0), (1, 1)], "name": "Client Call", "color": "#F5A623"},     # T-shape
+    {"cells": [(0, 0), (1, 0), (1, 1), (2, 1)], "name": "Workshop", "color": "#BD10E0"},        # Z-shape
+    {"cells": [(0, 0), (1, 0), (2, 0), (0, 1)], "name": "Review", "color": "#B8E986"},          # L-shape
+    {"cells": [(0, 0), (1, 0), (2, 0), (2, 1)], "name": "Planning", "color": "#50E3C2"},        # Reverse L
+    {"cells": [(0, 0), (1, 0), (1, 1)], "name": "1:1", "color": "#D0021B"},                     # Small L
+    {"cells": [(0, 0), (1, 0), (0, 1)], "name": "Sync", "color": "#9013FE"},                    # Small reverse L
+]
+
+_ORIENT_TABLES: dict[tuple[int, int], tuple] = {}
+
+
+def piece_orientations(width: int, height: int) -> tuple:
+    """Per piece: its distinct rotations, clockwise, with a mask for every
+    anchor on a ``width`` x ``height`` board (compiled once per board size)"""
+    table = _ORIENT_TABLES.get((width, height))
+    if table is None:
+        table = orientation_table([p["cells"] for p in PIECES], width, height)
+        _ORIENT_TABLES[(width, height)] = table
+    return table
+
+
 class PuzzleGame(Scene):
     name = "Calendar Scheduler Puzzle"
     
@@ -23,78 +49,131 @@ class PuzzleGame(Scene):
     CELL_SIZE = 30
     GRID_X = (CANVAS_W - GRID_W * CELL_SIZE) // 2
     GRID_Y = 100
+    HAND = 15  # pieces dealt per game
+    SOLVE_BUDGET = 200  # solver states per frame (~4 ms); longer checks carry over to later frames
 
     def __init__(self):
         self.started = False
         self.start_time = 0.0
         self.end_time = 0.0
-        self.grid = [[0 for _ in range(self.GRID_W)] for _ in range(self.GRID_H)]
-        self.remaining = []
+        self.board = Board(self.GRID_W, self.GRID_H)  # occupancy bits + piece per cell
+        self.orients = piece_orientations(self.GRID_W, self.GRID_H)
+        self.remaining: list[int] = []  # indices into self.pieces
         self.cur_idx = 0
-        self.cur_cells = []
-        self.pos = [0, 0]
+        self.rot = 0  # index into orients of the current piece
+        self.pos = [0, 0]  # top-left of the current piece's bounding box
+        self._dirty_cells: list[int] = []  # cell indices placed since the last draw
+        self._ghost_key = None  # what the current-piece items show right now
+        self.solver: Solver | None = None
+        self.index: PlacementIndex | None = None  # legal anchors per piece and rotation
+        self.seed = 0  # picks the hand, so a game can be replayed
+        self.plan: list[int] = []  # per hand slot, the mask it covers in a known packing
+        self._pending: str | None = None  # "hint" or "check" waiting on the solver
         
-        # Define meeting blocks (calendar-style pieces)
-        self.pieces = [
-            {"cells": [(0, 0), (1, 0), (0, 1), (1, 1)], "name": "Team Standup", "color": "#4A90E2"},  # 2x2 square
-            {"cells": [(0, 0), (1, 0), (2, 0), (3, 0)], "name": "All Hands", "color": "#7ED321"},      # 4x1 line
-            {"cells": [(0, 0), (1, 0), (2, 0), (1, 1)], "name": "Client Call", "color": "#F5A623"},     # T-shape
-            {"cells": [(0, 0), (1, 0), (1, 1), (2, 1)], "name": "Workshop", "color": "#BD10E0"},        # Z-shape
-            {"cells": [(0, 0), (1, 0), (2, 0), (0, 1)], "name": "Review", "color": "#B8E986"},          # L-shape
-            {"cells": [(0, 0), (1, 0), (2, 0), (2, 1)], "name": "Planning", "color": "#50E3C2"},        # Reverse L
-            {"cells": [(0, 0), (1, 0), (1, 1)], "name": "1:1", "color": "#D0021B"},                     # Small L
-            {"cells": [(0, 0), (1, 0), (0, 1)], "name": "Sync", "color": "#9013FE"},                    # Small reverse L
-        ]
+        self.pieces = PIECES
 
     def elapsed(self) -> float:
-        end = self.end_time if self.end_time else time.perf_counter()
+        end = self.end_time if self.end_time else self.clock.now()
         return max(0.0, end - self.start_time) if self.started else 0.0
 
-    def _rot_ccw(self, cells):
-        """Rotate cells 90 degrees counter-clockwise"""
-        return [(-y, x) for x, y in cells]
+    def _orient(self) -> Orientation | None:
+        """Current piece in its current rotation (None once the hand is used up)"""
+        if self.cur_idx < len(self.remaining):
+            return self.orients[self.remaining[self.cur_idx]][self.rot]
+        return None
+
+    def _rotate(self, turns):
+        """Turn the current piece clockwise (negative: counter-clockwise), keeping it on the board"""
+        orients = self.orients[self.remaining[self.cur_idx]]
+        self.rot = (self.rot + turns) % len(orients)
+        self._move(0, 0)
+
+    def _move(self, dx, dy):
+        o = self._orient()
+        self.pos = [clamp(self.pos[0] + dx, 0, self.GRID_W - o.w), clamp(self.pos[1] + dy, 0, self.GRID_H - o.h)]
 
-    def _rot_cw(self, cells):
-        """Rotate cells 90 degrees clockwise"""
-        return [(y, -x) for x, y in cells]
+    def _can_place(self, x, y, rot):
+        """Check if the current piece in rotation ``rot`` can be placed at position (x, y)"""
+        return self.index.fits(self.remaining[self.cur_idx], rot, x, y)
 
-    def _can_place(self, x, y, cells):
-        """Check if cells can be placed at position (x, y)"""
-        for dx, dy in cells:
-            nx, ny = x + dx, y + dy
-            if nx < 0 or nx >= self.GRID_W or ny < 0 or ny >= self.GRID_H:
-                return False
-            if self.grid[ny][nx] != 0:
-                return False
-        return True
+    def _nearest(self):
+        """Closest legal (rot, x, y) for the current piece, or None"""
+        return self.index.nearest(self.remaining[self.cur_idx], self.rot, self.pos[0], self.pos[1])
 
     def _place(self):
         """Place current piece at current position"""
-        current_piece = self.remaining[self.cur_idx]
-        for dx, dy in self.cur_cells:
-            x, y = self.pos[0] + dx, self.pos[1] + dy
-            self.grid[y][x] = current_piece  # Store the piece object instead of just 1
+        mask = self._orient().mask(self.GRID_W, self.pos[0], self.pos[1])
+        self._dirty_cells += self.board.place(mask, self.remaining[self.cur_idx])
+        self.index.fill(mask)
 
     def _advance_piece(self):
         """Move to next piece"""
         self.cur_idx += 1
-        if self.cur_idx < len(self.remaining):
-            self.cur_cells = self.remaining[self.cur_idx]["cells"]
-            self.pos = [0, 0]
-        else:
-            self.cur_cells = []
+        self.rot = 0
+        self.pos = [0, 0]
 
     def _is_grid_filled(self):
         """Check if the entire grid is filled (all cells have pieces)"""
-        for row in self.grid:
-            for cell in row:
-                if cell == 0:
-                    return False
-        return True
+        return self.board.is_full()
 
+    def _has_move(self):
+        """Can the current piece, in any rotation, still go anywhere?"""
+        return self.index.any(self.remaining[self.cur_idx])
+
+    def _counts(self, pieces):
+        """How many of each piece type are in ``pieces`` (the solver's view of a hand)"""
+        counts = [0] * len(self.pieces)
+        for idx in pieces:
+            counts[idx] += 1
+        return tuple(counts)
+
+    def _solvable(self, budget=None):
+        """Can every piece not yet placed still fit on the board together?
+
+        Free whenever the known packing's masks for those pieces are still
+        clear (placement order doesn't matter); otherwise the solver finds a
+        new packing, which becomes the known one. None if ``budget`` solver
+        states weren't enough to tell yet.
+        """
+        occupied = self.board.occupied
+        if self.plan and not any(occupied & m for m in self.plan[self.cur_idx:]):
+            return True
+        counts = self._counts(self.remaining[self.cur_idx:])
+        known = self.solver.solvable(occupied, counts, budget)
+        if known is None:
+            return None
+        found = self.solver.solve(occupied, counts) if known else None  # memoised by now
+        self.plan = assign(self.remaining, found, self.cur_idx) if found is not None else []
+        return known
+
+    def _hint(self):
+        """Rotation and position for the current piece that keep the rest packable, or None"""
+        if not self._solvable():
+            return None
+        mask = self.plan[self.cur_idx]
+        for rot, o in enumerate(self.orients[self.remaining[self.cur_idx]]):
+            if mask in o.masks:
+                anchor = o.masks.index(mask)
+                return rot, [anchor % self.GRID_W, anchor // self.GRID_W]
+        return None
+
+    def _settle(self, app: "GameApp") -> None:
+        """Give the pending hint or check one frame of solver time; act on it once decided"""
+        known = self._solvable(self.SOLVE_BUDGET)
+        if known is None:
+            return
+        pending, self._pending = self._pending, None
+        if pending == "hint":
+            hint = self._hint() if known else None
+            if hint is None:
+                app.toasts.add("No way left to fit every remaining meeting")
+            else:
+                self.rot, self.pos = hint
+        elif not known:
+            app.toasts.add("The remaining meetings can no longer all fit")
 
     def _finish(self, app: "GameApp", forced: bool = False) -> None:
-        self.end_time = time.perf_counter()
+        self.end_time = self.clock.now()
         over = max(0.0, self.elapsed() - CAL_TARGET_SECONDS)
         over_pen = math.floor(over / 10.0) * CAL_OVER_PENALTY_PER_10S
         
@@ -107,7 +186,8 @@ class PuzzleGame(Scene):
             name=self.name,
             elapsed=self.elapsed(),
             penalty=pen,
-            detail={"over_seconds": over, "unused_pieces": unused_pieces, "unused_penalty": unused_penalty},
+            detail={"over_seconds": over, "unused_pieces": unused_pieces, "unused_penalty": unused_penalty,
+                    "seed": self.seed},
         )
         app.run_results.append(result)
         from friday_escape import FridayEscape
@@ -118,112 +198,80 @@ class PuzzleGame(Scene):
         self.started = False
         self.start_time = 0.0
         self.end_time = 0.0
-        self.grid = [[0 for _ in range(self.GRID_W)] for _ in range(self.GRID_H)]
-        # Create a random set of pieces (with replacement, so pieces can be reused)
-        import random
-        self.remaining = [random.choice(self.pieces) for _ in range(15)]
+        self.board = Board(self.GRID_W, self.GRID_H)
+        self.orients = piece_orientations(self.GRID_W, self.GRID_H)
+        self.solver = Solver(self.board, self.orients)
+        self.index = PlacementIndex(self.orients, self.GRID_W)
+        # A hand of pieces (with replacement, so pieces can be reused) that is
+        # known to fit: read from the pre-built bank, or dealt and solved here
+        self.seed = app.rng.getrandbits(32)
+        if app.puzzles is not None:
+            self.remaining, self.plan = app.puzzles.pick(self.seed)
+        else:
+            import random
+            self.remaining, self.plan = deal(random.Random(self.seed), self.solver, self.HAND)
         self.cur_idx = 0
-        self.cur_cells = self.remaining[0]["cells"] if self.remaining else []
+        self.rot = 0
         self.pos = [0, 0]
+        self._pending = None
+        self._dirty_cells = []
+        self._ghost_key = None
+        self._build()
 
     def update(self, app: "GameApp", dt: float) -> None:
-        app.toasts.update(dt)
+        if self._pending is not None:
+            self._settle(app)
+        # Timer while placing pieces; toast expiry
+        if app.toasts.update(dt) or self.started:
+            self.invalidate()
 
-    def draw(self, app: "GameApp", c) -> None:
-        c.delete("all")
-        c.create_rectangle(0, 0, CANVAS_W, CANVAS_H, fill=BG, width=0)
+    def _build(self) -> None:
+        v = self.view
+        v.rect("bg", 0, 0, CANVAS_W, CANVAS_H, fill=BG, width=0)
         
         # Header
-        c.create_text(20, 20, text=self.name, fill=ACCENT, font=("TkDefaultFont", 18, "bold"), anchor="nw")
+        v.text("header", 20, 20, text=self.name, fill=ACCENT, font=("TkDefaultFont", 18, "bold"), anchor="nw")
         
-        # Instructions summary (top left)
-        if self.started:
-            c.create_text(
-                20,
-                50,
-                text="Arrows: move • Z/X: rotate • Space: place • Return: finish",
-                fill=MUTED,
-                font=("TkDefaultFont", 10),
-                anchor="nw",
-            )
-        
-        c.create_text(CANVAS_W - 20, 20, text=f"Time: {self.elapsed():.2f}s", fill=FG, font=("TkDefaultFont", 14, "bold"), anchor="ne")
-        c.create_text(CANVAS_W - 20, 44, text=f"Target: {CAL_TARGET_SECONDS:.0f}s", fill=MUTED, font=("TkDefaultFont", 12), anchor="ne")
-        c.create_text(CANVAS_W - 20, 64, text=f"Pieces: {self.cur_idx}/{len(self.remaining)}", fill=GOOD, font=("TkDefaultFont", 12), anchor="ne")
+        # Instructions summary (top left, shown once started)
+        v.text(
+            "hint",
+            20,
+            50,
+            text="Arrows: move • Z/X: rotate • S: snap • Space: place • H: hint • Return: finish",
+            fill=MUTED,
+            font=("TkDefaultFont", 10),
+            anchor="nw",
+            state="hidden",
+        )
         
-        # Show penalty info
-        unused_pieces = len(self.remaining) - self.cur_idx
-        if unused_pieces > 0:
-            penalty_text = f"Unused: {unused_pieces} (10s each)"
-            c.create_text(CANVAS_W - 20, 84, text=penalty_text, fill=WARN, font=("TkDefaultFont", 12), anchor="ne")
+        v.text("timer", CANVAS_W - 20, 20, text="", fill=FG, font=("TkDefaultFont", 14, "bold"), anchor="ne")
+        v.text("target", CANVAS_W - 20, 44, text=f"Target: {CAL_TARGET_SECONDS:.0f}s", fill=MUTED, font=("TkDefaultFont", 12), anchor="ne")
+        v.text("pieces", CANVAS_W - 20, 64, text="", fill=GOOD, font=("TkDefaultFont", 12), anchor="ne")
+        v.text("unused", CANVAS_W - 20, 84, text="", fill=WARN, font=("TkDefaultFont", 12), anchor="ne")
         
-        # Draw calendar grid
+        # Calendar grid: one persistent slot per cell, recoloured as meetings are placed
         for y in range(self.GRID_H):
             for x in range(self.GRID_W):
                 gx = self.GRID_X + x * self.CELL_SIZE
                 gy = self.GRID_Y + y * self.CELL_SIZE
-                if self.grid[y][x] != 0:
-                    # Draw placed meeting block with its original piece color
-                    placed_piece = self.grid[y][x]
-                    meeting_color = placed_piece.get("color", ACCENT)
-                    
-                    # Draw meeting block
-                    c.create_rectangle(gx + 1, gy + 1, gx + self.CELL_SIZE - 1, gy + self.CELL_SIZE - 1, 
-                                     fill=meeting_color, width=0)
-                    c.create_rectangle(gx, gy, gx + self.CELL_SIZE, gy + self.CELL_SIZE, 
-                                     fill="", width=1, outline=GRID)
-                else:
-                    # Draw empty calendar slot
-                    c.create_rectangle(gx, gy, gx + self.CELL_SIZE, gy + self.CELL_SIZE, 
-                                     fill=CARD, width=1, outline=GRID)
+                v.rect(f"cell{x}.{y}", gx, gy, gx + self.CELL_SIZE, gy + self.CELL_SIZE, 
+                       fill=CARD, width=1, outline=GRID)
         
-        # Draw current piece with meeting styling
-        if self.cur_cells and self.cur_idx < len(self.remaining):
-            current_piece = self.remaining[self.cur_idx]
-            piece_color = current_piece.get("color", ACCENT)
-            piece_name = current_piece.get("name", "Meeting")
-            
-            # Draw meeting blocks
-            for dx, dy in self.cur_cells:
-                px = self.pos[0] + dx
-                py = self.pos[1] + dy
-                if 0 <= px < self.GRID_W and 0 <= py < self.GRID_H:
-                    gx = self.GRID_X + px * self.CELL_SIZE
-                    gy = self.GRID_Y + py * self.CELL_SIZE
-                    # Draw meeting block with rounded corners effect
-                    c.create_rectangle(gx + 2, gy + 2, gx + self.CELL_SIZE - 2, gy + self.CELL_SIZE - 2, 
-                                     fill=piece_color, width=0)
-                    c.create_rectangle(gx, gy, gx + self.CELL_SIZE, gy + self.CELL_SIZE, 
-                                     fill="", width=2, outline=piece_color)
-            
-            # Show current meeting name
-            c.create_text(
-                CANVAS_W // 2, 
-                self.GRID_Y - 20, 
-                text=f"Current: {piece_name}", 
-                fill=piece_color, 
-                font=("TkDefaultFont", 12, "bold")
-            )
+        # Current piece: a filled block plus a border per cell, moved around by draw,
+        # and a dashed outline of the nearest free slot while it doesn't fit
+        most = max(len(orients[0].cells) for orients in self.orients)
+        for i in range(most):
+            v.rect(f"snap{i}", 0, 0, 0, 0, fill="", width=2, dash=(4, 2), state="hidden")
+        for i in range(most):
+            v.rect(f"ghost{i}", 0, 0, 0, 0, width=0, state="hidden")
+            v.rect(f"ghost{i}.border", 0, 0, 0, 0, fill="", width=2, state="hidden")
+        v.text("current", CANVAS_W // 2, self.GRID_Y - 20, text="", font=("TkDefaultFont", 12, "bold"))
         
         # Instructions
-        if not self.started:
-            # BCG-style professional overlay
-            c.create_rectangle(0, 0, CANVAS_W, CANVAS_H, fill="#1a1a2e", stipple="gray25", width=0)
-            
-            # Header section
-            c.create_rectangle(40, 80, CANVAS_W - 40, 120, fill="#0f3460", width=2, outline="#4a90e2")
-            c.create_text(
-                CANVAS_W // 2,
-                100,
-                text="BCG STRATEGIC CALENDAR OPTIMIZATION ASSESSMENT",
-                fill="#4a90e2",
-                font=("TkDefaultFont", 16, "bold"),
-            )
-            
-            # Main content box
-            c.create_rectangle(60, 140, CANVAS_W - 60, 400, fill="#2c3e50", width=2, outline="#34495e")
-            
-            lines = [
+        build_start_overlay(
+            v,
+            "BCG STRATEGIC CALENDAR OPTIMIZATION ASSESSMENT",
+            [
                 "STRATEGIC PLANNING SCENARIO:",
                 "Optimize your executive calendar by scheduling",
                 "18 critical meetings without conflicts.",
@@ -234,31 +282,85 @@ class PuzzleGame(Scene):
                 "• Optimize executive calendar allocation",
                 "",
                 "OPERATIONAL INSTRUCTIONS:",
-                "Arrow keys: navigate, Z/X: rotate, Space: place",
+                "Arrow keys: navigate, Z/X: rotate, S: snap to a free slot",
+                "Space: place, H: hint",
                 "Return: finish early (10s penalty per unscheduled meeting)",
                 "",
                 "Press Enter to Begin Assessment"
-            ]
-            c.create_text(
-                CANVAS_W // 2,
-                270,
-                text="\n".join(lines),
-                fill="#ecf0f1",
-                font=("TkDefaultFont", 12),
-                justify="center",
-            )
-            
-            # Professional call-to-action button
-            c.create_rectangle(CANVAS_W // 2 - 150, 420, CANVAS_W // 2 + 150, 460, fill="#e74c3c", width=0)
-            c.create_text(
-                CANVAS_W // 2,
-                440,
-                text="BEGIN CALENDAR ASSESSMENT",
-                fill="#ffffff",
-                font=("TkDefaultFont", 12, "bold"),
-            )
+            ],
+            "BEGIN CALENDAR ASSESSMENT",
+        )
+
+    def draw(self, app: "GameApp", c) -> None:
+        v = self.view
+        v.show("hint", self.started)
+        v.config("timer", text=f"Time: {self.elapsed():.2f}s")
+        v.config("pieces", text=f"Pieces: {self.cur_idx}/{len(self.remaining)}")
+        
+        # Show penalty info
+        unused_pieces = len(self.remaining) - self.cur_idx
+        v.config("unused", text=f"Unused: {unused_pieces} (10s each)", state="normal" if unused_pieces > 0 else "hidden")
+        
+        # Calendar grid: recolour only the cells _place filled since the last draw
+        for i in self._dirty_cells:
+            x, y = i % self.GRID_W, i // self.GRID_W
+            v.config(f"cell{x}.{y}", fill=self.pieces[self.board.owner[i]].get("color", ACCENT))
+        self._dirty_cells.clear()
         
-        app.toasts.draw(c)
+        # Current piece: only touched when it moved, rotated or was replaced
+        ghost_key = (self.cur_idx, self.pos[0], self.pos[1], self.rot)
+        if ghost_key != self._ghost_key:
+            self._ghost_key = ghost_key
+            self._update_ghost(v)
+        
+        v.show_group("overlay", not self.started)
+        app.toasts.draw(v)
+
+    def _update_ghost(self, v) -> None:
+        """Move the current-piece items with coords and recolour them for a new piece"""
+        cells = []
+        snap = []
+        orient = self._orient()
+        if orient is not None:
+            current_piece = self.pieces[self.remaining[self.cur_idx]]
+            piece_color = current_piece.get("color", ACCENT)
+            piece_name = current_piece.get("name", "Meeting")
+            cells = [(self.pos[0] + dx, self.pos[1] + dy) for dx, dy in orient.cells]
+            v.config("current", text=f"Current: {piece_name}", fill=piece_color, state="normal")
+            # Red while it would clash; then show where it would snap to
+            if not self._can_place(self.pos[0], self.pos[1], self.rot):
+                piece_color = BAD
+                near = self._nearest()
+                if near is not None:
+                    rot, x, y = near
+                    snap = [(x + dx, y + dy) for dx, dy in self.orients[self.remaining[self.cur_idx]][rot].cells]
+        else:
+            v.show("current", False)
+        
+        i = 0
+        for px, py in cells:
+            if 0 <= px < self.GRID_W and 0 <= py < self.GRID_H:
+                gx = self.GRID_X + px * self.CELL_SIZE
+                gy = self.GRID_Y + py * self.CELL_SIZE
+                v.move(f"ghost{i}", gx + 2, gy + 2, gx + self.CELL_SIZE - 2, gy + self.CELL_SIZE - 2)
+                v.config(f"ghost{i}", fill=piece_color, state="normal")
+                v.move(f"ghost{i}.border", gx, gy, gx + self.CELL_SIZE, gy + self.CELL_SIZE)
+                v.config(f"ghost{i}.border", outline=piece_color, state="normal")
+                i += 1
+        while f"ghost{i}" in v:
+            v.show(f"ghost{i}", False)
+            v.show(f"ghost{i}.border", False)
+            i += 1
+        
+        for i in range(len(snap)):
+            gx = self.GRID_X + snap[i][0] * self.CELL_SIZE
+            gy = self.GRID_Y + snap[i][1] * self.CELL_SIZE
+            v.move(f"snap{i}", gx + 1, gy + 1, gx + self.CELL_SIZE - 1, gy + self.CELL_SIZE - 1)
+            v.config(f"snap{i}", outline=MUTED, state="normal")
+        i = len(snap)
+        while f"snap{i}" in v:
+            v.show(f"snap{i}", False)
+            i += 1
 
     def handle_key(self, app: "GameApp", e) -> None:
         if e.keysym == "Escape":
@@ -267,35 +369,52 @@ class PuzzleGame(Scene):
         if not self.started:
             if e.keysym in ("Return", "space"):
                 self.started = True
-                self.start_time = time.perf_counter()
+                self.start_time = self.clock.now()
             return
         
         # Active controls
         if e.keysym in ("Left", "Right", "Up", "Down"):
             dx = (e.keysym == "Right") - (e.keysym == "Left")
             dy = (e.keysym == "Down") - (e.keysym == "Up")
-            nx, ny = self.pos[0] + dx, self.pos[1] + dy
-            # Allow moving even if invalid; placement will check
-            self.pos = [clamp(nx, 0, self.GRID_W - 1), clamp(ny, 0, self.GRID_H - 1)]
+            # Allow moving onto other meetings; placement will check
+            self._move(dx, dy)
             return
         
         if e.keysym.lower() == "z":
-            self.cur_cells = self._rot_ccw(self.cur_cells)
+            self._rotate(-1)
             return
         
         if e.keysym.lower() == "x":
-            self.cur_cells = self._rot_cw(self.cur_cells)
+            self._rotate(1)
             return
         
         # Removed skip functionality - must place all pieces
         
+        if e.keysym.lower() == "s":
+            near = self._nearest()
+            if near is not None:
+                self.rot, self.pos = near[0], [near[1], near[2]]
+            return
+        
+        if e.keysym.lower() == "h":
+            self._pending = "hint"
+            self._settle(app)
+            return
+        
         if e.keysym == "space":
-            if self._can_place(self.pos[0], self.pos[1], self.cur_cells):
+            if self._can_place(self.pos[0], self.pos[1], self.rot):
                 self._place()
                 self._advance_piece()
                 # Check if all pieces have been used
                 if self.cur_idx >= len(self.remaining):
                     self._finish(app)
+                elif not self._has_move():
+                    app.toasts.add("No room left for this meeting - Return to finish")
+                else:
+                    self._pending = "check"
+                    self._settle(app)
+            elif not self._has_move():
+                app.toasts.add("No room left for this meeting - Return to finish")
             else:
                 app.toasts.add("Doesn't fit here")
             return
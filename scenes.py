@@ -3,6 +3,7 @@ Menu, interlude, and results scenes for Consulting Chaos game.
 """
 from __future__ import annotations
 
+import math
 from typing import TYPE_CHECKING, Optional
 
 from game_common import Scene, MinigameResult, CANVAS_W, CANVAS_H, BG, FG, ACCENT, GOOD, MUTED, CARD, GRID, WARN, BAD
@@ -16,23 +17,35 @@ class MainMenu(Scene):
 
     def __init__(self):
         self.blink = 0.0
+        self._entered = 0.0
 
     def on_enter(self, app: "GameApp") -> None:
+        # Blink phase follows the clock, not summed dt, so idle sleeps keep it in time
+        self._entered = self.clock.now()
         self.blink = 0.0
+        self._build(app)
 
     def update(self, app: "GameApp", dt: float) -> None:
-        self.blink += dt
+        phase = int(self.blink * 2) % 2
+        self.blink = self.clock.now() - self._entered
+        if int(self.blink * 2) % 2 != phase:
+            self.invalidate()
+
+    def idle_for(self, app: "GameApp") -> Optional[float]:
+        # Only the call-to-action blink animates: sleep until its next flip
+        return 0.5 - self.blink % 0.5
+
+    def _build(self, app: "GameApp") -> None:
+        v = self.view
 
-    def draw(self, app: "GameApp", c) -> None:
-        c.delete("all")
-        
         # BCG green theme background
-        c.create_rectangle(0, 0, CANVAS_W, CANVAS_H, fill=BG, width=0)
-        c.create_rectangle(0, 0, CANVAS_W, 80, fill=GRID, width=0)
+        v.rect("bg", 0, 0, CANVAS_W, CANVAS_H, fill=BG, width=0)
+        v.rect("bg.top", 0, 0, CANVAS_W, 80, fill=GRID, width=0)
         
         # BCG-style header with green theme
-        c.create_rectangle(20, 20, CANVAS_W - 20, 60, fill=GOOD, width=2, outline=ACCENT)
-        c.create_text(
+        v.rect("header", 20, 20, CANVAS_W - 20, 60, fill=GOOD, width=2, outline=ACCENT)
+        v.text(
+            "header.text",
             CANVAS_W // 2,
             40,
             text="BOSTON CONSULTING GROUP",
@@ -41,7 +54,8 @@ class MainMenu(Scene):
         )
         
         # Main title with green styling
-        c.create_text(
+        v.text(
+            "title",
             CANVAS_W // 2,
             120,
             text="CONSULTING CHAOS",
@@ -50,7 +64,8 @@ class MainMenu(Scene):
         )
         
         # Subtitle with professional styling
-        c.create_text(
+        v.text(
+            "subtitle",
             CANVAS_W // 2,
             150,
             text="Strategic Excellence Under Pressure",
@@ -59,7 +74,7 @@ class MainMenu(Scene):
         )
         
         # Professional description box with proper sizing
-        c.create_rectangle(40, 180, CANVAS_W - 40, 360, fill=CARD, width=2, outline=ACCENT)
+        v.rect("desc", 40, 180, CANVAS_W - 40, 360, fill=CARD, width=2, outline=ACCENT)
         lines = [
             "You are a BCG consultant racing against client deadlines.",
             "Complete the four strategic assessments as fast as you can to demonstrate your excellence.",
@@ -71,7 +86,8 @@ class MainMenu(Scene):
             "",
             "Controls: Arrows, letters; Enter/Space = Continue; Esc = Quit at any time",
         ]
-        c.create_text(
+        v.text(
+            "desc.text",
             CANVAS_W // 2,
             270,
             text="\n".join(lines),
@@ -83,27 +99,29 @@ class MainMenu(Scene):
         
         # Professional call-to-action with green theme
         hint = "Press Enter to Begin Strategic Assessment"
-        if int(self.blink * 2) % 2 == 0:
-            c.create_rectangle(CANVAS_W // 2 - 200, 390, CANVAS_W // 2 + 200, 430, fill=ACCENT, width=0)
-            c.create_text(
-                CANVAS_W // 2,
-                410,
-                text=hint,
-                fill="#ffffff",
-                font=("TkDefaultFont", 14, "bold"),
-            )
+        v.rect("cta", CANVAS_W // 2 - 200, 390, CANVAS_W // 2 + 200, 430, fill=ACCENT, width=0)
+        v.text(
+            "cta.text",
+            CANVAS_W // 2,
+            410,
+            text=hint,
+            fill="#ffffff",
+            font=("TkDefaultFont", 14, "bold"),
+        )
 
         # Professional performance metrics with green theme
         if app.scores.best_total_seconds is not None:
-            c.create_rectangle(40, 460, CANVAS_W - 40, 510, fill=GOOD, width=2, outline=ACCENT)
-            c.create_text(
+            v.rect("best", 40, 460, CANVAS_W - 40, 510, fill=GOOD, width=2, outline=ACCENT)
+            v.text(
+                "best.title",
                 CANVAS_W // 2,
                 480,
                 text="PERSONAL BEST PERFORMANCE",
                 fill="#ffffff",
                 font=("TkDefaultFont", 12, "bold"),
             )
-            c.create_text(
+            v.text(
+                "best.total",
                 CANVAS_W // 2,
                 500,
                 text=f"Total Time: {app.scores.best_total_seconds:.2f}s",
@@ -111,6 +129,9 @@ class MainMenu(Scene):
                 font=("TkDefaultFont", 14, "bold"),
             )
 
+    def draw(self, app: "GameApp", c) -> None:
+        self.view.show_group("cta", int(self.blink * 2) % 2 == 0)
+
     def handle_key(self, app: "GameApp", e) -> None:
         if e.keysym in ("Escape",):
             app.quit()
@@ -129,14 +150,12 @@ class Interlude(Scene):
         self.last_result = last_result
         self.timer = 0.0
 
-    def update(self, app: "GameApp", dt: float) -> None:
-        self.timer += dt
-
-    def draw(self, app: "GameApp", c) -> None:
-        c.delete("all")
-        c.create_rectangle(0, 0, CANVAS_W, CANVAS_H, fill=BG, width=0)
+    def on_enter(self, app: "GameApp") -> None:
+        v = self.view
+        v.rect("bg", 0, 0, CANVAS_W, CANVAS_H, fill=BG, width=0)
         y = 150
-        c.create_text(
+        v.text(
+            "title",
             CANVAS_W // 2,
             y,
             text="Interlude",
@@ -145,7 +164,8 @@ class Interlude(Scene):
         )
         y += 40
         if self.last_result is not None:
-            c.create_text(
+            v.text(
+                "result",
                 CANVAS_W // 2,
                 y,
                 text=(
@@ -157,7 +177,8 @@ class Interlude(Scene):
                 font=("TkDefaultFont", 14),
             )
             y += 30
-        c.create_text(
+        v.text(
+            "hint",
             CANVAS_W // 2,
             y + 10,
             text="Press Enter to continue",
@@ -165,6 +186,12 @@ class Interlude(Scene):
             font=("TkDefaultFont", 16, "bold"),
         )
 
+    def update(self, app: "GameApp", dt: float) -> None:
+        self.timer += dt
+
+    def idle_for(self, app: "GameApp") -> Optional[float]:
+        return math.inf  # static until Enter
+
     def handle_key(self, app: "GameApp", e) -> None:
         if e.keysym in ("Return", "space"):
             app.scenes.switch(self.next_scene)
@@ -190,25 +217,39 @@ class Results(Scene):
         self.is_best = app.scores.maybe_update(self.total, self.individual_times)
         if self.is_best:
             self.showing_input = True
+        self.view.rect("bg", 0, 0, CANVAS_W, CANVAS_H, fill=BG, width=0)
+        self._build_input_screen(self.view)
+        self._build_results_screen(self.view)
+
+    def idle_for(self, app: "GameApp") -> Optional[float]:
+        return math.inf  # name entry and leaderboard only change on key presses
 
     def draw(self, app: "GameApp", c) -> None:
-        c.delete("all")
-        c.create_rectangle(0, 0, CANVAS_W, CANVAS_H, fill=BG, width=0)
-        
+        v = self.view
+        v.show_group("input", self.showing_input)
+        v.show_group("results", not self.showing_input)
         if self.showing_input:
-            self._draw_input_screen(c)
-        else:
-            self._draw_results_screen(c)
+            if self.input_mode == "name":
+                v.config("input.label", text="Enter your name:")
+                v.config("input.value", text=self.player_name + "_")
+            else:
+                v.config("input.label", text="Enter your title:")
+                v.config("input.value", text=self.player_title + "_")
+        elif self.leaderboard_position is not None:
+            v.config("position", text=f"Leaderboard Position: #{self.leaderboard_position + 1}")
+        v.show("position", not self.showing_input and self.leaderboard_position is not None)
 
-    def _draw_input_screen(self, c) -> None:
-        c.create_text(
+    def _build_input_screen(self, v) -> None:
+        v.text(
+            "input.title",
             CANVAS_W // 2,
             100,
             text="NEW PERSONAL BEST!",
             fill=GOOD,
             font=("TkDefaultFont", 24, "bold"),
         )
-        c.create_text(
+        v.text(
+            "input.total",
             CANVAS_W // 2,
             150,
             text=f"Total Time: {self.total:.2f}s",
@@ -218,7 +259,8 @@ class Results(Scene):
         
         # Show individual times
         y = 200
-        c.create_text(
+        v.text(
+            "input.individual",
             CANVAS_W // 2,
             y,
             text="Individual Times:",
@@ -226,8 +268,9 @@ class Results(Scene):
             font=("TkDefaultFont", 14, "bold"),
         )
         y += 30
-        for r in self.results:
-            c.create_text(
+        for i, r in enumerate(self.results):
+            v.text(
+                f"input.time{i}",
                 CANVAS_W // 2,
                 y,
                 text=f"{r.name}: {r.total:.2f}s",
@@ -236,40 +279,27 @@ class Results(Scene):
             )
             y += 25
         
-        # Input fields
+        # Input fields (label and value are retargeted by draw for name/title)
         y += 20
-        if self.input_mode == "name":
-            c.create_text(
-                CANVAS_W // 2,
-                y,
-                text="Enter your name:",
-                fill=ACCENT,
-                font=("TkDefaultFont", 16, "bold"),
-            )
-            c.create_text(
-                CANVAS_W // 2,
-                y + 30,
-                text=self.player_name + "_",
-                fill=FG,
-                font=("TkDefaultFont", 14),
-            )
-        else:
-            c.create_text(
-                CANVAS_W // 2,
-                y,
-                text="Enter your title:",
-                fill=ACCENT,
-                font=("TkDefaultFont", 16, "bold"),
-            )
-            c.create_text(
-                CANVAS_W // 2,
-                y + 30,
-                text=self.player_title + "_",
-                fill=FG,
-                font=("TkDefaultFont", 14),
-            )
+        v.text(
+            "input.label",
+            CANVAS_W // 2,
+            y,
+            text="Enter your name:",
+            fill=ACCENT,
+            font=("TkDefaultFont", 16, "bold"),
+        )
+        v.text(
+            "input.value",
+            CANVAS_W // 2,
+            y + 30,
+            text="_",
+            fill=FG,
+            font=("TkDefaultFont", 14),
+        )
         
-        c.create_text(
+        v.text(
+            "input.help",
             CANVAS_W // 2,
             CANVAS_H - 60,
             text="[Enter] Continue    [Backspace] Edit",
@@ -290,8 +320,9 @@ class Results(Scene):
         else:
             return "Back to Training", BAD, "Even interns are faster than this... 😅"
 
-    def _draw_results_screen(self, c) -> None:
-        c.create_text(
+    def _build_results_screen(self, v) -> None:
+        v.text(
+            "results.title",
             CANVAS_W // 2,
             90,
             text="RESULTS",
@@ -299,8 +330,9 @@ class Results(Scene):
             font=("TkDefaultFont", 30, "bold"),
         )
         y = 150
-        for r in self.results:
-            c.create_text(
+        for i, r in enumerate(self.results):
+            v.text(
+                f"results.row{i}",
                 CANVAS_W // 2,
                 y,
                 text=f"{r.name:16s}  {r.elapsed:.2f}s + {r.penalty:.2f}s  =  {r.total:.2f}s",
@@ -309,7 +341,8 @@ class Results(Scene):
             )
             y += 28
         y += 10
-        c.create_text(
+        v.text(
+            "results.total",
             CANVAS_W // 2,
             y,
             text=f"TOTAL: {self.total:.2f}s",
@@ -320,7 +353,8 @@ class Results(Scene):
         
         # Performance evaluation
         rank_text, rank_color, funny_description = self._get_performance_rank()
-        c.create_text(
+        v.text(
+            "results.eval",
             CANVAS_W // 2,
             y,
             text="PERFORMANCE EVALUATION",
@@ -328,7 +362,8 @@ class Results(Scene):
             font=("TkDefaultFont", 16, "bold"),
         )
         y += 30
-        c.create_text(
+        v.text(
+            "results.rank",
             CANVAS_W // 2,
             y,
             text=rank_text,
@@ -336,7 +371,8 @@ class Results(Scene):
             font=("TkDefaultFont", 20, "bold"),
         )
         y += 30
-        c.create_text(
+        v.text(
+            "results.rank_desc",
             CANVAS_W // 2,
             y,
             text=funny_description,
@@ -345,17 +381,18 @@ class Results(Scene):
         )
         y += 40
         
-        if self.leaderboard_position is not None:
-            c.create_text(
-                CANVAS_W // 2,
-                y,
-                text=f"Leaderboard Position: #{self.leaderboard_position + 1}",
-                fill=GOOD,
-                font=("TkDefaultFont", 16, "bold"),
-            )
-            y += 30
+        # Filled in by draw once the entry has been added to the leaderboard
+        v.text(
+            "position",
+            CANVAS_W // 2,
+            y,
+            text="",
+            fill=GOOD,
+            font=("TkDefaultFont", 16, "bold"),
+        )
         
-        c.create_text(
+        v.text(
+            "results.help",
             CANVAS_W // 2,
             CANVAS_H - 60,
             text="[Enter] Play Again    [Esc] Quit",
@@ -0,0 +1,69 @@
+"""
+Friday Escape checks, run headless on the recording canvas:
+    python -m pytest test_friday_escape.py
+"""
+from main import GameApp
+from escape_nav import FlowField
+from friday_escape import FridayEscape
+
+
+class FoggyEscape(FridayEscape):
+    FOG = 4
+
+
+def test_exit_stays_visible_in_sight(tmp_path):
+    app = GameApp(headless=True, scores_path=tmp_path / "scores.json")
+    scene = FoggyEscape()
+    app.scenes.switch(scene)
+    graph, sight = scene.nav.graph, scene.sight
+    ex, ey = scene.exit
+    # stand on a tile that has the exit in its sight line, then redraw the fog
+    spot = next(graph.pos(i) for i in range(len(sight.row))
+                if graph.floor[i] and graph.pos(i) != scene.exit
+                and ((graph.pos(i)[1] == ey and sight.row[i] >> ex & 1)
+                     or (graph.pos(i)[0] == ex and sight.col[i] >> ey & 1)))
+    scene.player = scene.player_prev = spot
+    scene.draw(app, app.canvas)
+
+    v, canvas = scene.view, app.canvas
+    # geometry as drawn, read back from the canvas like Tk's ``coords``
+    lit = canvas.coords(v.items["lit.row" if spot[1] == ey else "lit.col"])
+    x0, y0, x1, y1 = canvas.coords(v.items["exit"])
+    assert lit[0] <= x0 and x1 <= lit[2] and lit[1] <= y0 and y1 <= lit[3]
+    # the recording canvas stacks items in creation order
+    for cover in ("fog", "lit.row", "lit.col"):
+        assert v.items["exit"] > v.items[cover]
+        assert v.items["start"] > v.items[cover]
+    assert canvas.items[v.items["exit"]]["opts"].get("state") != "hidden"
+
+
+class DoorEscape(FridayEscape):
+    DOORS = 4
+
+
+def test_doors_never_cut_off_the_exit(tmp_path):
+    app = GameApp(headless=True, scores_path=tmp_path / "scores.json")
+    for _ in range(20):
+        scene = DoorEscape()
+        app.scenes.switch(scene)
+        graph = scene.nav.graph
+        for _ in range(30):
+            scene._toggle_door(app)
+            assert scene.exit_nav.dist[graph.index(scene.player)] >= 0
+            assert scene.exit_nav.dist[graph.index(scene.start)] >= 0
+
+
+def test_replay_checked_without_path_table(tmp_path):
+    app = GameApp(headless=True, scores_path=tmp_path / "scores.json")
+    scene = FridayEscape()
+    app.scenes.switch(scene)
+    scene.paths = None  # as on mazes too big for an all-pairs table
+    graph = scene.nav.graph
+    exit_nav = FlowField(graph)
+    exit_nav.retarget(graph.index(scene.exit))
+    scene.trail = [[graph.index(scene.start)]]
+    while scene.trail[-1][-1] != graph.index(scene.exit):
+        scene.trail[-1].append(exit_nav.next_hop[scene.trail[-1][-1]])
+    assert scene.replay_valid()
+    scene.trail[-1].insert(1, scene.trail[-1][0] + 2 * graph.w)  # jumps a tile
+    assert not scene.replay_valid()